@@ -16,6 +16,16 @@ from ..core.security import audit_logger
 from ..models.patient import ConversationEntry, CrisisAlert, RiskLevel
 
 
+# Crisis alert severity per assessed risk level; anything else is critical
+_ALERT_SEVERITY = {
+    RiskLevel.HIGH: "high",
+    RiskLevel.MODERATE: "medium"
+}
+
+# Risk levels that call for immediate therapist follow-up
+_ELEVATED_RISK_LEVELS = frozenset((RiskLevel.HIGH, RiskLevel.CRISIS))
+
+
 class MentalHealthContext(BaseModel):
     """Context for mental health conversations."""
     patient_id: str
@@ -307,11 +317,7 @@ Is there someone safe you can be with right now?"""
             alert_type = "psychosis_indicators"
         
         # Determine severity
-        severity = "critical"
-        if ai_response.risk_assessment == RiskLevel.HIGH:
-            severity = "high"
-        elif ai_response.risk_assessment == RiskLevel.MODERATE:
-            severity = "medium"
+        severity = _ALERT_SEVERITY.get(ai_response.risk_assessment, "critical")
         
         return CrisisAlert(
             patient_id=context.patient_id,
@@ -429,7 +435,7 @@ Is there someone safe you can be with right now?"""
         """Generate recommendations for therapist follow-up."""
         recommendations = []
         
-        if context.patient_risk_level in [RiskLevel.HIGH, RiskLevel.CRISIS]:
+        if context.patient_risk_level in _ELEVATED_RISK_LEVELS:
             recommendations.append("• Immediate follow-up required due to elevated risk level")
         
         crisis_count = sum(1 for e in context.conversation_history if e.escalation_triggered)
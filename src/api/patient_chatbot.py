@@ -3,14 +3,20 @@ Patient-facing chatbot API with HIPAA compliance and crisis detection.
 Provides secure, therapeutic AI interaction for patients between sessions.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 
 from ..ai.mental_health_agent import mental_health_agent, MentalHealthContext, AIResponse
+from ..core.config import settings
+from ..core.http import get_http_client
 from ..core.security import audit_logger, patient_encryption
 from ..models.patient import ConversationEntry, CrisisAlert, RiskLevel, ConsentStatus
 
@@ -19,11 +25,23 @@ from ..models.patient import ConversationEntry, CrisisAlert, RiskLevel, ConsentS
 security = HTTPBearer(auto_error=False)
 router = APIRouter(prefix="/chat", tags=["Patient Chatbot"])
 
+# Characters of the triggering message kept in crisis audit entries
+CRISIS_TRIGGER_PREVIEW_CHARS = 100
+
+# Largest accepted chat message, and the largest request body that can carry
+# one (every character JSON-escaped as \uXXXX, plus room for the other fields)
+MAX_CHAT_MESSAGE_LENGTH = 2000
+MAX_CHAT_MESSAGE_BODY_BYTES = MAX_CHAT_MESSAGE_LENGTH * 6 + 1024
+
+# Crisis notifications go out on the shared HTTP client but must not wait on
+# a slow webhook as long as regular service calls do
+CRISIS_NOTIFICATION_TIMEOUT_SECONDS = 5.0
+
 
 # Request/Response Models
 class ChatMessage(BaseModel):
     """Patient chat message."""
-    message: str = Field(..., min_length=1, max_length=2000)
+    message: str = Field(..., min_length=1, max_length=MAX_CHAT_MESSAGE_LENGTH)
     session_id: Optional[str] = None
 
 
@@ -121,8 +139,8 @@ async def send_chat_message(
             detail="Patient consent required for AI interaction"
         )
     
-    # Log the interaction
-    await audit_logger.log_access(
+    # Log the interaction while the message is being processed
+    started_audit = asyncio.create_task(audit_logger.log_access(
         user_id=session.therapist_id,
         patient_id=session.patient_id,
         action="patient_chat_message",
@@ -130,7 +148,7 @@ async def send_chat_message(
         outcome="started",
         ip_address=request.client.host if request else None,
         user_agent=request.headers.get("user-agent") if request else None
-    )
+    ))
     
     try:
         # Get conversation context
@@ -152,6 +170,8 @@ async def send_chat_message(
             patient_message=message.message,
             context=context
         )
+        risk_value = ai_response.risk_assessment.value
+        await started_audit
         
         # Update session
         session.last_activity = datetime.utcnow()
@@ -170,12 +190,9 @@ async def send_chat_message(
                 "emergency": "Call 911 if in immediate danger",
                 "your_therapist": "Your therapist has been notified and will contact you soon"
             }
-            
-            # TODO: Send actual crisis notification to therapist
-            await _notify_therapist_of_crisis(session.therapist_id, crisis_alert)
         
         # Log successful interaction
-        await audit_logger.log_access(
+        success_audit = audit_logger.log_access(
             user_id=session.therapist_id,
             patient_id=session.patient_id,
             action="patient_chat_message",
@@ -183,21 +200,30 @@ async def send_chat_message(
             outcome="success",
             details={
                 "message_length": len(message.message),
-                "risk_level": ai_response.risk_assessment.value,
+                "risk_level": risk_value,
                 "crisis_alert": crisis_alert is not None
             }
         )
         
+        if crisis_alert:
+            await asyncio.gather(
+                _notify_therapist_of_crisis(session.therapist_id, crisis_alert),
+                success_audit
+            )
+        else:
+            await success_audit
+        
         return ChatResponse(
             message=ai_response.message,
             session_id=session.session_id,
             timestamp=datetime.utcnow(),
-            risk_level=ai_response.risk_assessment.value,
+            risk_level=risk_value,
             crisis_resources=crisis_resources,
             therapist_notified=therapist_notified
         )
         
     except Exception as e:
+        await started_audit
         await audit_logger.log_access(
             user_id=session.therapist_id,
             patient_id=session.patient_id,
@@ -365,47 +391,81 @@ async def get_conversation_history(
     if not context:
         return {"messages": []}
     
-    # Return recent messages (patient view)
+    # Return recent messages (patient view), encoded one at a time
     recent_messages = context.conversation_history[-limit:]
     
-    return {
-        "session_id": session.session_id,
-        "message_count": len(recent_messages),
-        "messages": [
-            {
-                "timestamp": msg.timestamp,
-                "type": msg.message_type,
-                "content": msg.content if msg.message_type != "system_note" else "[System message]",
-                "from": "You" if msg.message_type == "patient_message" else "AI Support"
-            }
-            for msg in recent_messages
-        ]
-    }
+    return StreamingResponse(
+        _stream_conversation_history(session.session_id, recent_messages),
+        media_type="application/json"
+    )
+
+
+async def _stream_conversation_history(
+    session_id: str,
+    messages: List[ConversationEntry]
+) -> AsyncIterator[bytes]:
+    """Stream the conversation history document without building the full message list."""
+    
+    header = orjson.dumps({"session_id": session_id, "message_count": len(messages)})
+    yield header[:-1] + b',"messages":['
+    
+    separator = b""
+    for msg in messages:
+        yield separator + orjson.dumps({
+            "timestamp": msg.timestamp,
+            "type": msg.message_type,
+            "content": msg.content if msg.message_type != "system_note" else "[System message]",
+            "from": "You" if msg.message_type == "patient_message" else "AI Support"
+        })
+        separator = b","
+    
+    yield b"]}"
 
 
 async def _notify_therapist_of_crisis(therapist_id: str, crisis_alert: CrisisAlert):
     """
     Notify therapist of crisis alert.
-    In production, this would send real notifications.
+    Posts the alert to the configured notification webhook, if any.
     """
     
-    # TODO: Implement actual therapist notification system
+    # TODO: Implement remaining notification channels
     # - Email alert
-    # - SMS alert  
     # - Push notification to therapist app
     # - Create urgent task in therapist dashboard
     
+    outcome = "success"
+    details = {
+        "alert_type": crisis_alert.alert_type,
+        "severity": crisis_alert.severity,
+        "trigger_message": crisis_alert.trigger_message[:CRISIS_TRIGGER_PREVIEW_CHARS]
+    }
+    
+    if settings.crisis_notification_webhook_url:
+        # Only alert metadata leaves the system - never the patient's message
+        try:
+            response = await get_http_client().post(
+                settings.crisis_notification_webhook_url,
+                timeout=CRISIS_NOTIFICATION_TIMEOUT_SECONDS,
+                json={
+                    "therapist_id": therapist_id,
+                    "patient_id": crisis_alert.patient_id,
+                    "alert_type": crisis_alert.alert_type,
+                    "severity": crisis_alert.severity,
+                    "created_at": crisis_alert.created_at.isoformat()
+                }
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            outcome = "failure"
+            details["notification_error"] = str(e)
+    
     await audit_logger.log_access(
         user_id=therapist_id,
         patient_id=crisis_alert.patient_id,
         action="crisis_alert_sent",
         resource="therapist_notification",
-        outcome="success",
-        details={
-            "alert_type": crisis_alert.alert_type,
-            "severity": crisis_alert.severity,
-            "trigger_message": crisis_alert.trigger_message[:100]
-        }
+        outcome=outcome,
+        details=details
     )
     
     print(f"CRISIS ALERT: Therapist {therapist_id} notified of {crisis_alert.alert_type} for patient {crisis_alert.patient_id}")
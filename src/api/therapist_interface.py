@@ -3,22 +3,46 @@ Therapist-facing API interface that completely abstracts away GoHighLevel comple
 Therapists see only therapy-relevant information and never need to know about GHL.
 """
 
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+import asyncio
+import time
+from datetime import datetime, date, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Dict, Any, Tuple
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPBearer
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..ai.mental_health_agent import mental_health_agent, MentalHealthContext
-from ..core.security import jwt_manager, audit_logger
-from ..ghl.mcp_client import create_therapist_mcp_client
+from ..core.cache import TTLCache
+from ..core.security import SecurityError, jwt_manager, audit_logger, set_audit_identity
+from ..ghl.mcp_client import MCPError, mcp_pool
 from ..models.patient import PatientSummary, CrisisAlert, PatientConversation
 from ..models.therapist import TherapistResponse, TherapistDashboard
 
 
 # Security
-security = HTTPBearer()
+class BearerToken(HTTPBearer):
+    """
+    Bearer auth dependency that returns the raw token string.
+    Keeps HTTPBearer's OpenAPI scheme but skips building a credentials model.
+    """
+    
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get("authorization")
+        if not authorization or authorization[:7].lower() != "bearer ":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+        return authorization[7:]
+
+
+security = BearerToken()
 router = APIRouter(prefix="/therapist", tags=["Therapist Interface"])
 
 
@@ -59,6 +83,39 @@ class ConversationReviewRequest(BaseModel):
     date_range: Optional[str] = "last_7_days"
 
 
+# Pre-built defaults for requests sent without a body, so the common case
+# skips model validation entirely
+_DEFAULT_DASHBOARD_REQ = TherapistDashboardRequest()
+_DEFAULT_PATIENT_LIST_REQ = PatientListRequest()
+_DEFAULT_CONVERSATION_REVIEW_REQ = ConversationReviewRequest(patient_id="", conversation_id="")
+
+
+# Validators for the hot POST bodies, built once at import and applied
+# straight to the raw JSON bytes
+_SEND_MESSAGE_ADAPTER = TypeAdapter(SendMessageRequest)
+_SESSION_NOTE_ADAPTER = TypeAdapter(SessionNoteRequest)
+
+
+async def _validate_json_body(adapter: TypeAdapter, request: Request) -> Any:
+    """Validate a request body, reporting errors the way FastAPI's body binding does."""
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+def _json_body_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for routes that parse their body in a dependency."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
 # Response Models
 class TherapistDashboardResponse(BaseModel):
     """Therapist dashboard response - therapy-focused, not CRM-focused."""
@@ -90,11 +147,57 @@ class ConversationSummaryResponse(BaseModel):
     recommended_actions: List[str]
 
 
+# Static description of the therapist interface (contains no PHI), serialized once
+_INTERFACE_INFO_JSON = orjson.dumps({
+    "interface_type": "Therapy-Focused Practice Management",
+    "what_you_see": [
+        "Patient summaries (anonymized)",
+        "AI conversation insights",
+        "Session scheduling",
+        "Crisis alerts and risk assessments",
+        "Therapeutic communication tools",
+        "HIPAA-compliant documentation"
+    ],
+    "what_is_hidden": [
+        "GoHighLevel CRM interface",
+        "Marketing campaign tools",
+        "Sales pipeline management",
+        "Lead generation features",
+        "Business analytics dashboards",
+        "Payment processing details"
+    ],
+    "backend_integration": {
+        "platform": "GoHighLevel (abstracted)",
+        "security": "HIPAA-compliant encryption",
+        "ai_features": "PydanticAI + DSPy optimization",
+        "crisis_detection": "Real-time monitoring",
+        "audit_logging": "Full compliance tracking"
+    },
+    "therapist_benefits": [
+        "No CRM complexity to learn",
+        "Focus purely on patient care",
+        "AI-powered insights and support",
+        "Automated compliance and documentation",
+        "Seamless patient communication"
+    ]
+})
+
+
+# Resolved therapists keyed by id; short-lived so profile and status changes
+# show up quickly, and bounded so expired entries don't linger
+_THERAPIST_CACHE_TTL_SECONDS = 60.0
+_THERAPIST_CACHE_MAX_ENTRIES = 1024
+_therapist_cache = TTLCache(_THERAPIST_CACHE_TTL_SECONDS, _THERAPIST_CACHE_MAX_ENTRIES)
+
+
 # Dependency to get current therapist
-async def get_current_therapist(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TherapistResponse:
+async def get_current_therapist(token: str = Depends(security)) -> TherapistResponse:
     """Get current authenticated therapist."""
     try:
-        token_data = jwt_manager.verify_token(credentials.credentials)
+        token_data = jwt_manager.get_cached_payload(token)
+        if token_data is None:
+            # Signature verification is CPU-bound; keep it off the event loop
+            token_data = await run_in_threadpool(jwt_manager.verify_token, token)
         therapist_id = token_data.get("sub")
         
         if not therapist_id:
@@ -102,10 +205,16 @@ async def get_current_therapist(credentials: HTTPAuthorizationCredentials = Depe
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication token"
             )
+        set_audit_identity(user_id=therapist_id)
+        
+        cached = _therapist_cache.get(therapist_id)
+        if cached is not None:
+            return cached
         
         # TODO: Get therapist from database
         # For now, return mock therapist
-        return TherapistResponse(
+        now = datetime.now(timezone.utc)
+        therapist = TherapistResponse(
             id=therapist_id,
             email="therapist@example.com",
             first_name="Dr.",
@@ -114,30 +223,52 @@ async def get_current_therapist(credentials: HTTPAuthorizationCredentials = Depe
             license_number="12345",
             license_state="CA",
             status="active",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             is_verified=True
         )
+        _therapist_cache.set(therapist_id, therapist)
         
-    except Exception as e:
+        return therapist
+        
+    except (SecurityError, ValueError) as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
-        )
+        ) from e
+
+
+# Body parsers depend on authentication so unauthenticated requests get a 401
+# before their body is validated; FastAPI resolves the therapist once per request
+async def parse_send_message_request(
+    request: Request,
+    _therapist: TherapistResponse = Depends(get_current_therapist)
+) -> SendMessageRequest:
+    """Parse the send-message body."""
+    return await _validate_json_body(_SEND_MESSAGE_ADAPTER, request)
+
+
+async def parse_session_note_request(
+    request: Request,
+    _therapist: TherapistResponse = Depends(get_current_therapist)
+) -> SessionNoteRequest:
+    """Parse the session-note body."""
+    return await _validate_json_body(_SESSION_NOTE_ADAPTER, request)
 
 
 @router.get("/dashboard", response_model=TherapistDashboardResponse)
 async def get_therapist_dashboard(
-    request: TherapistDashboardRequest = TherapistDashboardRequest(),
+    request: Optional[TherapistDashboardRequest] = None,
     therapist: TherapistResponse = Depends(get_current_therapist)
 ) -> TherapistDashboardResponse:
     """
     Get therapist dashboard with therapy-focused metrics.
     No CRM complexity - just what therapists need to see.
     """
+    request = request or _DEFAULT_DASHBOARD_REQ
     
     # Log dashboard access
-    await audit_logger.log_access(
+    audit_logger.log_access_nowait(
         user_id=therapist.id,
         patient_id=None,
         action="dashboard_access",
@@ -146,61 +277,16 @@ async def get_therapist_dashboard(
     )
     
     try:
-        # Get MCP client for this therapist
-        mcp_client = await create_therapist_mcp_client(therapist)
-        
-        # Get dashboard data from GHL (but present it therapy-focused)
-        dashboard_data = await mcp_client.get_therapist_dashboard_data(therapist.id)
-        
-        # Transform to therapy-focused format
-        overview = {
-            "active_patients": dashboard_data.get("active_patients", 0),
-            "todays_sessions": dashboard_data.get("todays_sessions", 0),
-            "pending_messages": dashboard_data.get("pending_messages", 0),
-            "crisis_alerts": dashboard_data.get("crisis_alerts", 0),
-            "interface_note": "This is your therapy practice dashboard - simplified and HIPAA-compliant"
-        }
-        
-        # Mock data for demonstration
-        todays_schedule = [
-            {
-                "time": "10:00 AM",
-                "patient_initials": "J.D.",
-                "session_type": "Individual Therapy",
-                "duration": "50 minutes",
-                "status": "confirmed"
-            },
-            {
-                "time": "2:00 PM",
-                "patient_initials": "M.S.",
-                "session_type": "Follow-up Session",
-                "duration": "50 minutes",
-                "status": "confirmed"
-            }
-        ]
-        
-        patient_alerts = []  # Would come from crisis detection system
-        
-        recent_messages = [
-            {
-                "patient_initials": "A.B.",
-                "preview": "Thank you for the session yesterday...",
-                "timestamp": "2 hours ago",
-                "type": "AI conversation"
-            }
-        ]
-        
-        weekly_summary = {
-            "sessions_completed": 15,
-            "new_patients": 2,
-            "crisis_interventions": 0,
-            "ai_conversations": 28,
-            "patient_satisfaction": "94%"
-        }
-        
-        await mcp_client.close()
+        # Crisis alerts are always loaded fresh; the other sections may be cached
+        (
+            (overview, todays_schedule, recent_messages, weekly_summary),
+            patient_alerts
+        ) = await asyncio.gather(
+            _load_cacheable_sections(therapist, request.date_range),
+            _load_patient_alerts(therapist)
+        )
         
-        return TherapistDashboardResponse(
+        return TherapistDashboardResponse.model_construct(
             overview=overview,
             todays_schedule=todays_schedule,
             patient_alerts=patient_alerts,
@@ -208,24 +294,202 @@ async def get_therapist_dashboard(
             weekly_summary=weekly_summary
         )
         
-    except Exception as e:
+    except (ValueError, KeyError) as e:
+        # Section loaders report MCP failures in their data, so only
+        # processing errors reach here
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to load dashboard: {str(e)}"
-        )
+        ) from e
+
+
+# Cacheable dashboard sections keyed by (therapist id, date range);
+# per-therapist keys keep one therapist's data from reaching another. Only the
+# known date ranges are cached so arbitrary request values can't grow the cache
+_DASHBOARD_CACHE_TTL_SECONDS = 60.0
+_DASHBOARD_CACHE_MAX_ENTRIES = 1024
+_CACHEABLE_DATE_RANGES = frozenset((None, "today", "week", "month"))
+_dashboard_cache = TTLCache(_DASHBOARD_CACHE_TTL_SECONDS, _DASHBOARD_CACHE_MAX_ENTRIES)
+
+
+async def _load_cacheable_sections(
+    therapist: TherapistResponse,
+    date_range: Optional[str]
+) -> Tuple[Any, ...]:
+    """Load overview, schedule, recent messages and weekly summary, reusing a recent result."""
+    
+    cacheable = date_range in _CACHEABLE_DATE_RANGES
+    key = (therapist.id, date_range)
+    if cacheable:
+        cached = _dashboard_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    # Load each section concurrently
+    sections = tuple(await asyncio.gather(
+        _load_overview(therapist),
+        _load_todays_schedule(therapist),
+        _load_recent_messages(therapist),
+        _load_weekly_summary(therapist)
+    ))
+    if cacheable:
+        _dashboard_cache.set(key, sections)
+    
+    return sections
+
+
+async def _load_overview(therapist: TherapistResponse) -> Dict[str, Any]:
+    """Load practice overview from GHL (but present it therapy-focused)."""
+    
+    # Get MCP client for this therapist
+    mcp_client = await mcp_pool.get(therapist)
+    dashboard_data = await mcp_client.get_therapist_dashboard_data(therapist.id)
+    
+    # Transform to therapy-focused format
+    return {
+        "active_patients": dashboard_data.get("active_patients", 0),
+        "todays_sessions": dashboard_data.get("todays_sessions", 0),
+        "pending_messages": dashboard_data.get("pending_messages", 0),
+        "crisis_alerts": dashboard_data.get("crisis_alerts", 0),
+        "interface_note": "This is your therapy practice dashboard - simplified and HIPAA-compliant"
+    }
+
+
+async def _load_todays_schedule(therapist: TherapistResponse) -> List[Dict[str, Any]]:
+    """Load today's sessions for the therapist."""
+    
+    # Mock data for demonstration
+    return [
+        {
+            "time": "10:00 AM",
+            "patient_initials": "J.D.",
+            "session_type": "Individual Therapy",
+            "duration": "50 minutes",
+            "status": "confirmed"
+        },
+        {
+            "time": "2:00 PM",
+            "patient_initials": "M.S.",
+            "session_type": "Follow-up Session",
+            "duration": "50 minutes",
+            "status": "confirmed"
+        }
+    ]
+
+
+async def _load_patient_alerts(therapist: TherapistResponse) -> List[CrisisAlert]:
+    """Load open crisis alerts for the therapist's patients."""
+    return []  # Would come from crisis detection system
+
+
+async def _load_recent_messages(therapist: TherapistResponse) -> List[Dict[str, Any]]:
+    """Load recent patient message previews."""
+    
+    # Mock data for demonstration
+    return [
+        {
+            "patient_initials": "A.B.",
+            "preview": "Thank you for the session yesterday...",
+            "timestamp": "2 hours ago",
+            "type": "AI conversation"
+        }
+    ]
+
+
+async def _load_weekly_summary(therapist: TherapistResponse) -> Dict[str, Any]:
+    """Load the therapist's weekly activity summary."""
+    
+    # Mock data for demonstration
+    return {
+        "sessions_completed": 15,
+        "new_patients": 2,
+        "crisis_interventions": 0,
+        "ai_conversations": 28,
+        "patient_satisfaction": "94%"
+    }
+
+
+# Dashboard sections in the order the UI lays them out
+_DASHBOARD_SECTION_LOADERS: Tuple[Tuple[str, Callable[[TherapistResponse], Awaitable[Any]]], ...] = (
+    ("overview", _load_overview),
+    ("todays_schedule", _load_todays_schedule),
+    ("patient_alerts", _load_patient_alerts),
+    ("recent_messages", _load_recent_messages),
+    ("weekly_summary", _load_weekly_summary)
+)
+
+
+@router.get("/dashboard/stream")
+async def stream_therapist_dashboard(
+    therapist: TherapistResponse = Depends(get_current_therapist)
+) -> StreamingResponse:
+    """
+    Stream dashboard sections as NDJSON in the order they finish loading.
+    Lets the UI render fast sections before slower GHL-backed ones arrive.
+    """
+    
+    audit_logger.log_access_nowait(
+        user_id=therapist.id,
+        patient_id=None,
+        action="dashboard_access",
+        resource="therapist_dashboard",
+        outcome="success",
+        details={"streamed": True}
+    )
+    
+    return StreamingResponse(
+        _stream_dashboard_sections(therapist),
+        media_type="application/x-ndjson"
+    )
+
+
+async def _stream_dashboard_sections(therapist: TherapistResponse) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per dashboard section as each loader completes."""
+    
+    pending = [
+        _load_dashboard_section(name, loader, therapist)
+        for name, loader in _DASHBOARD_SECTION_LOADERS
+    ]
+    for next_section in asyncio.as_completed(pending):
+        name, data, error = await next_section
+        if error is None:
+            line = {"type": name, "data": data}
+        else:
+            line = {"type": name, "error": f"Failed to load {name}: {error}"}
+        yield orjson.dumps(line, default=_dump_model) + b"\n"
+
+
+async def _load_dashboard_section(
+    name: str,
+    loader: Callable[[TherapistResponse], Awaitable[Any]],
+    therapist: TherapistResponse
+) -> Tuple[str, Any, Optional[str]]:
+    """Run one section loader, reporting failures instead of aborting the stream."""
+    try:
+        return name, await loader(therapist), None
+    except (MCPError, ValueError, KeyError) as e:
+        return name, None, str(e)
+
+
+def _dump_model(obj: Any) -> Dict[str, Any]:
+    """orjson fallback for pydantic models nested in section data."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError
 
 
 @router.get("/patients", response_model=PatientListResponse)
 async def get_patient_list(
-    request: PatientListRequest = PatientListRequest(),
+    request: Optional[PatientListRequest] = None,
     therapist: TherapistResponse = Depends(get_current_therapist)
 ) -> PatientListResponse:
     """
     Get anonymized patient list for therapist.
     Shows therapy-relevant info only, no CRM details.
     """
+    request = request or _DEFAULT_PATIENT_LIST_REQ
     
-    await audit_logger.log_access(
+    audit_logger.log_access_nowait(
         user_id=therapist.id,
         patient_id=None,
         action="patient_list_access",
@@ -233,13 +497,15 @@ async def get_patient_list(
         outcome="success"
     )
     
-    # Mock patient data (would come from database)
+    # Mock patient data (would come from list_patient_summaries once a
+    # database session is available)
+    now = datetime.now(timezone.utc)
     mock_patients = [
         PatientSummary(
             anonymous_id="anon_abc123",
             initials="J.D.",
             risk_level="low",
-            last_contact=datetime.utcnow(),
+            last_contact=now,
             recent_activity="AI conversation 2 hours ago",
             flags=[]
         ),
@@ -247,13 +513,13 @@ async def get_patient_list(
             anonymous_id="anon_def456",
             initials="M.S.",
             risk_level="moderate",
-            last_contact=datetime.utcnow(),
+            last_contact=now,
             recent_activity="Session yesterday",
             flags=["Follow-up needed"]
         )
     ]
     
-    return PatientListResponse(
+    return PatientListResponse.model_construct(
         patients=mock_patients,
         total_count=len(mock_patients),
         high_risk_count=0,
@@ -261,18 +527,19 @@ async def get_patient_list(
     )
 
 
-@router.post("/patients/{patient_id}/message")
+@router.post("/patients/{patient_id}/message", openapi_extra=_json_body_schema(SendMessageRequest))
 async def send_patient_message(
     patient_id: str,
-    request: SendMessageRequest,
-    therapist: TherapistResponse = Depends(get_current_therapist)
+    therapist: TherapistResponse = Depends(get_current_therapist),
+    request: SendMessageRequest = Depends(parse_send_message_request)
 ):
     """
     Send message to patient through secure channel.
     Messages go through GHL but therapist doesn't see that complexity.
     """
     
-    await audit_logger.log_access(
+    set_audit_identity(patient_id=patient_id)
+    audit_logger.log_access_nowait(
         user_id=therapist.id,
         patient_id=patient_id,
         action="send_patient_message",
@@ -282,7 +549,7 @@ async def send_patient_message(
     
     try:
         # Get MCP client
-        mcp_client = await create_therapist_mcp_client(therapist)
+        mcp_client = await mcp_pool.get(therapist)
         
         # Get patient's GHL contact ID (encrypted in our database)
         # TODO: Implement patient lookup
@@ -296,9 +563,7 @@ async def send_patient_message(
             message_type="sms"
         )
         
-        await mcp_client.close()
-        
-        await audit_logger.log_access(
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="send_patient_message",
@@ -312,8 +577,8 @@ async def send_patient_message(
             "delivery_status": message_result.status
         }
         
-    except Exception as e:
-        await audit_logger.log_access(
+    except (MCPError, ValueError) as e:
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="send_patient_message",
@@ -325,21 +590,40 @@ async def send_patient_message(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to send message: {str(e)}"
-        )
+        ) from e
+
+
+# AI conversation summaries keyed by (therapist id, patient id, conversation id,
+# date range). They hold PHI, so the cache is bounded and expired summaries are
+# purged on every write rather than left in memory
+_SUMMARY_CACHE_TTL_SECONDS = 300.0
+_SUMMARY_CACHE_MAX_ENTRIES = 1024
+_summary_cache = TTLCache(_SUMMARY_CACHE_TTL_SECONDS, _SUMMARY_CACHE_MAX_ENTRIES)
+
+# Summary returned when no conversation is selected, without calling the agent
+_EMPTY_CONVERSATION_SUMMARY = "No conversation activity to summarize."
 
 
 @router.get("/patients/{patient_id}/conversation", response_model=ConversationSummaryResponse)
 async def get_patient_conversation_summary(
     patient_id: str,
-    request: ConversationReviewRequest = ConversationReviewRequest(patient_id="", conversation_id=""),
+    request: Optional[ConversationReviewRequest] = None,
     therapist: TherapistResponse = Depends(get_current_therapist)
 ) -> ConversationSummaryResponse:
     """
     Get AI conversation summary for therapist review.
     Provides clinical insights without exposing raw GHL data.
     """
+    request = request or _DEFAULT_CONVERSATION_REVIEW_REQ
     
-    await audit_logger.log_access(
+    if request.patient_id and request.patient_id != patient_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="patient_id mismatch"
+        )
+    
+    set_audit_identity(patient_id=patient_id)
+    audit_logger.log_access_nowait(
         user_id=therapist.id,
         patient_id=patient_id,
         action="conversation_review",
@@ -357,10 +641,18 @@ async def get_patient_conversation_summary(
             conversation_history=[]
         )
         
-        # Generate session summary using AI agent
-        ai_summary = await mental_health_agent.generate_session_summary(context)
+        # Generate session summary using AI agent, reusing a recent one so
+        # repeated refreshes don't re-run the summary
+        summary_key = (therapist.id, patient_id, request.conversation_id, request.date_range)
+        if not request.conversation_id:
+            ai_summary = _EMPTY_CONVERSATION_SUMMARY
+        else:
+            ai_summary = _summary_cache.get(summary_key)
+            if ai_summary is None:
+                ai_summary = await mental_health_agent.generate_session_summary(context)
+                _summary_cache.set(summary_key, ai_summary)
         
-        await audit_logger.log_access(
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="conversation_review",
@@ -368,8 +660,8 @@ async def get_patient_conversation_summary(
             outcome="success"
         )
         
-        return ConversationSummaryResponse(
-            conversation_id=request.conversation_id or "mock_conv_123",
+        return ConversationSummaryResponse.model_construct(
+            conversation_id=request.conversation_id,
             patient_anonymous_id=patient_id,
             date_range=request.date_range or "last_7_days",
             total_messages=12,
@@ -384,8 +676,8 @@ async def get_patient_conversation_summary(
             ]
         )
         
-    except Exception as e:
-        await audit_logger.log_access(
+    except (ValueError, KeyError) as e:
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="conversation_review",
@@ -397,21 +689,22 @@ async def get_patient_conversation_summary(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate conversation summary: {str(e)}"
-        )
+        ) from e
 
 
-@router.post("/patients/{patient_id}/session-note")
+@router.post("/patients/{patient_id}/session-note", openapi_extra=_json_body_schema(SessionNoteRequest))
 async def add_session_note(
     patient_id: str,
-    request: SessionNoteRequest,
-    therapist: TherapistResponse = Depends(get_current_therapist)
+    therapist: TherapistResponse = Depends(get_current_therapist),
+    request: SessionNoteRequest = Depends(parse_session_note_request)
 ):
     """
     Add session note for patient.
     Notes are encrypted and stored securely.
     """
     
-    await audit_logger.log_access(
+    set_audit_identity(patient_id=patient_id)
+    audit_logger.log_access_nowait(
         user_id=therapist.id,
         patient_id=patient_id,
         action="add_session_note",
@@ -423,8 +716,9 @@ async def add_session_note(
         # TODO: Encrypt and store session note
         # TODO: Update patient record in database
         # TODO: Sync relevant data to GHL if needed
+        now = datetime.now(timezone.utc)
         
-        await audit_logger.log_access(
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="add_session_note",
@@ -435,12 +729,12 @@ async def add_session_note(
         
         return {
             "message": "Session note added successfully",
-            "note_id": f"note_{datetime.utcnow().timestamp()}",
-            "created_at": datetime.utcnow()
+            "note_id": f"note_{time.time_ns():x}",
+            "created_at": now
         }
         
-    except Exception as e:
-        await audit_logger.log_access(
+    except (SecurityError, ValueError) as e:
+        audit_logger.log_access_nowait(
             user_id=therapist.id,
             patient_id=patient_id,
             action="add_session_note",
@@ -452,7 +746,7 @@ async def add_session_note(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to add session note: {str(e)}"
-        )
+        ) from e
 
 
 @router.get("/interface-info")
@@ -464,36 +758,4 @@ async def get_interface_info(
     Explains what they're seeing vs. what's hidden.
     """
     
-    return {
-        "interface_type": "Therapy-Focused Practice Management",
-        "what_you_see": [
-            "Patient summaries (anonymized)",
-            "AI conversation insights",
-            "Session scheduling",
-            "Crisis alerts and risk assessments",
-            "Therapeutic communication tools",
-            "HIPAA-compliant documentation"
-        ],
-        "what_is_hidden": [
-            "GoHighLevel CRM interface",
-            "Marketing campaign tools",
-            "Sales pipeline management",
-            "Lead generation features",
-            "Business analytics dashboards",
-            "Payment processing details"
-        ],
-        "backend_integration": {
-            "platform": "GoHighLevel (abstracted)",
-            "security": "HIPAA-compliant encryption",
-            "ai_features": "PydanticAI + DSPy optimization",
-            "crisis_detection": "Real-time monitoring",
-            "audit_logging": "Full compliance tracking"
-        },
-        "therapist_benefits": [
-            "No CRM complexity to learn",
-            "Focus purely on patient care",
-            "AI-powered insights and support",
-            "Automated compliance and documentation",
-            "Seamless patient communication"
-        ]
-    }
\ No newline at end of file
+    return Response(content=_INTERFACE_INFO_JSON, media_type="application/json")
@@ -0,0 +1,54 @@
+"""
+Bounded in-process cache with per-entry expiry.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Mapping whose entries expire after a fixed TTL, capped at max_entries.
+    Entries are kept in write order, and with a fixed TTL that is also expiry
+    order, so each write drops every expired entry from the front before
+    evicting the oldest live ones past the cap.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key and purge expired or excess entries."""
+        now = time.monotonic()
+        self._entries[key] = (now + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[oldest_key]
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop key if present."""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
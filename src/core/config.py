@@ -3,26 +3,40 @@ HIPAA-compliant configuration management for mental health chatbot.
 """
 
 import os
-from functools import lru_cache
+import re
+from functools import cached_property, lru_cache
 from typing import List, Optional
 
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+# Splits comma-separated env values and strips the surrounding whitespace in one pass
+_CSV_RE = re.compile(r"\s*,\s*")
 
 
 class Settings(BaseSettings):
     """Application settings with HIPAA compliance built-in."""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
+    
     # Environment
     environment: str = Field("development", env="ENVIRONMENT")
     debug: bool = Field(False, env="DEBUG")
     log_level: str = Field("INFO", env="LOG_LEVEL")
+    workers: int = Field(1, env="WORKERS", ge=1)  # Uvicorn worker processes
     
     # Security & HIPAA Compliance
     secret_key: str = Field(..., env="SECRET_KEY", min_length=32)
     encryption_algorithm: str = Field("HS256", env="ENCRYPTION_ALGORITHM")
     access_token_expire_minutes: int = Field(30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(7, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    bcrypt_rounds: int = Field(12, env="BCRYPT_ROUNDS", ge=4, le=31)
     patient_data_encryption_key: str = Field(..., env="PATIENT_DATA_ENCRYPTION_KEY")
     audit_log_retention_days: int = Field(2555, env="AUDIT_LOG_RETENTION_DAYS")  # 7 years
     
@@ -54,6 +68,7 @@ class Settings(BaseSettings):
     crisis_hotline_numbers: List[str] = Field(["988", "1-800-273-8255"], env="CRISIS_HOTLINE_NUMBERS")
     emergency_contact_email: str = Field(..., env="EMERGENCY_CONTACT_EMAIL")
     therapist_escalation_threshold: str = Field("high_risk", env="THERAPIST_ESCALATION_THRESHOLD")
+    crisis_notification_webhook_url: Optional[str] = Field(None, env="CRISIS_NOTIFICATION_WEBHOOK_URL")
     session_timeout_minutes: int = Field(30, env="SESSION_TIMEOUT_MINUTES")
     patient_anonymization_enabled: bool = Field(True, env="PATIENT_ANONYMIZATION_ENABLED")
     
@@ -85,14 +100,14 @@ class Settings(BaseSettings):
     test_patient_data: bool = Field(False, env="TEST_PATIENT_DATA")
     bypass_hipaa_checks: bool = Field(False, env="BYPASS_HIPAA_CHECKS")
     
-    @validator("crisis_hotline_numbers", pre=True)
+    @field_validator("crisis_hotline_numbers", mode="before")
+    @classmethod
     def parse_crisis_hotlines(cls, v):
         """Parse crisis hotline numbers from string or list."""
-        if isinstance(v, str):
-            return [num.strip() for num in v.split(",")]
-        return v
+        return _CSV_RE.split(v.strip()) if isinstance(v, str) else v
     
-    @validator("environment")
+    @field_validator("environment")
+    @classmethod
     def validate_environment(cls, v):
         """Ensure environment is valid."""
         valid_environments = ["development", "staging", "production"]
@@ -100,37 +115,33 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {valid_environments}")
         return v
     
-    @validator("patient_data_encryption_key", "database_encryption_key", "backup_encryption_key")
+    @field_validator("patient_data_encryption_key", "database_encryption_key", "backup_encryption_key")
+    @classmethod
     def validate_encryption_keys(cls, v):
         """Ensure encryption keys are properly formatted."""
         if len(v) < 32:
             raise ValueError("Encryption keys must be at least 32 characters long")
         return v
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.environment == "development"
     
-    @property
+    @cached_property
     def hipaa_compliant_mode(self) -> bool:
         """Check if HIPAA compliance is enforced."""
         return self.is_production or not self.bypass_hipaa_checks
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
 
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings."""
+    """Get cached application settings (hot paths import ``settings`` directly)."""
     return Settings()
 
 
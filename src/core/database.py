@@ -0,0 +1,53 @@
+"""
+Shared async database engine and session factory.
+"""
+
+from typing import Optional
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from .config import settings
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB column values with orjson (drivers expect str)."""
+    return orjson.dumps(value).decode()
+
+
+# Process-wide engine and session factory, created on first use so importing
+# the app never needs the database driver; disposed in the application lifespan
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_engine() -> AsyncEngine:
+    """Return the shared engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        # JSON columns (e.g. therapist preferences) encode and decode through orjson
+        _engine = create_async_engine(
+            settings.database_url,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads
+        )
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the shared session factory, creating it on first use."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(get_engine(), expire_on_commit=False)
+    return _session_factory
+
+
+async def close_database():
+    """Dispose of the engine's connection pool, if one was created."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_factory = None
@@ -0,0 +1,32 @@
+"""
+Shared outbound HTTP client so service calls reuse pooled connections.
+"""
+
+from typing import Optional
+
+import httpx
+
+
+# Process-wide client, created on first use and closed in the application
+# lifespan; HTTP/2 multiplexes concurrent MCP calls over a single connection
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use or after it was closed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client; the next get_http_client() call opens a new one."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
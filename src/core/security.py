@@ -3,16 +3,25 @@ HIPAA-compliant security utilities for mental health chatbot.
 Implements encryption, hashing, and audit logging required for healthcare data.
 """
 
+import asyncio
 import base64
 import hashlib
 import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from jose import JWTError, jwt
+from loguru import logger
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
@@ -37,6 +46,73 @@ class AuditLogEntry(BaseModel):
     details: Optional[Dict[str, Any]] = None
 
 
+class AuditIdentity:
+    """Caller identity recorded on audit entries for the current request."""
+    
+    __slots__ = ("user_id", "patient_id")
+    
+    def __init__(self):
+        self.user_id: Optional[str] = None
+        self.patient_id: Optional[str] = None
+
+
+# Identity of the request being served. The logging middleware binds a fresh
+# holder per request; route dependencies run in a child task of it, so they
+# fill in the shared holder instead of setting the variable themselves
+audit_identity: ContextVar[Optional[AuditIdentity]] = ContextVar("audit_identity", default=None)
+
+
+def bind_audit_identity() -> AuditIdentity:
+    """Start a fresh audit identity for the current request."""
+    identity = AuditIdentity()
+    audit_identity.set(identity)
+    return identity
+
+
+def set_audit_identity(user_id: Optional[str] = None, patient_id: Optional[str] = None) -> None:
+    """Record the caller on the current request's audit identity, if one is bound."""
+    identity = audit_identity.get()
+    if identity is None:
+        return
+    if user_id is not None:
+        identity.user_id = user_id
+    if patient_id is not None:
+        identity.patient_id = patient_id
+
+
+# Every Fernet token starts with the 0x80 version byte and a 64-bit timestamp,
+# which base64-encodes to this prefix
+_FERNET_TOKEN_PREFIX = b"gAAAAA"
+
+
+# Audit queue bounds: callers wait once this many entries are pending, and the
+# writer persists up to _AUDIT_BATCH_SIZE entries at a time
+_AUDIT_QUEUE_MAX_ENTRIES = 10_000
+_AUDIT_BATCH_SIZE = 100
+_AUDIT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Queued in place of an entry to tell the writer to finish its batch and exit;
+# flush() gives it this long before falling back to draining inline
+_AUDIT_WRITER_STOP = None
+_AUDIT_WRITER_STOP_TIMEOUT_SECONDS = 10.0
+
+# BLAKE2b key for anonymized patient ids
+_ANONYMIZATION_KEY = b"patient_anonymization_salt_v1"
+
+# Generated password characters; 256 rounded down to a multiple of the
+# alphabet size is the largest unbiased byte value
+_PASSWORD_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+_PASSWORD_BYTE_CUTOFF = 256 - (256 % len(_PASSWORD_ALPHABET))
+
+# Verified JWT payloads kept by JWTManager
+_TOKEN_CACHE_MAX_ENTRIES = 4096
+
+# PBKDF2 output per key, keyed by the SHA-256 of the password; derivation
+# takes ~100 ms so repeated constructions with the same key reuse it
+_DERIVED_KEY_CACHE_MAX_ENTRIES = 16
+_derived_keys: Dict[bytes, bytes] = {}
+
+
 class HIPAAEncryption:
     """HIPAA-compliant encryption utilities."""
     
@@ -45,7 +121,13 @@ class HIPAAEncryption:
         self.fernet = Fernet(self._derive_key(encryption_key))
     
     def _derive_key(self, password: str) -> bytes:
-        """Derive encryption key from password using PBKDF2."""
+        """Derive encryption key from password using PBKDF2, reusing earlier derivations."""
+        # Keyed by digest so the cache never holds the password itself
+        password_digest = hashlib.sha256(password.encode()).digest()
+        key = _derived_keys.get(password_digest)
+        if key is not None:
+            return key
+        
         salt = b'mental_health_chatbot_salt_v1'  # Use consistent salt for key derivation
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
@@ -54,36 +136,66 @@ class HIPAAEncryption:
             iterations=100000,
         )
         key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        
+        if len(_derived_keys) >= _DERIVED_KEY_CACHE_MAX_ENTRIES:
+            _derived_keys.pop(next(iter(_derived_keys)))
+        _derived_keys[password_digest] = key
         return key
     
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Encrypt raw bytes and return the Fernet token bytes."""
+        return self.fernet.encrypt(data)
+    
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """Decrypt Fernet token bytes back to the original bytes."""
+        try:
+            return self.fernet.decrypt(token)
+        except Exception as e:
+            raise SecurityError(f"Decryption failed: {str(e)}")
+    
     def encrypt(self, data: Union[str, bytes]) -> str:
-        """Encrypt data and return base64 encoded string."""
+        """Encrypt data and return the Fernet token (already urlsafe base64)."""
         if isinstance(data, str):
             data = data.encode('utf-8')
         
-        encrypted_data = self.fernet.encrypt(data)
-        return base64.urlsafe_b64encode(encrypted_data).decode('utf-8')
+        return self.encrypt_bytes(data).decode('ascii')
     
     def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt base64 encoded string and return original data."""
-        try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode('utf-8'))
-            decrypted_data = self.fernet.decrypt(encrypted_bytes)
-            return decrypted_data.decode('utf-8')
-        except Exception as e:
-            raise SecurityError(f"Decryption failed: {str(e)}")
+        """Decrypt a Fernet token and return original data."""
+        token = encrypted_data.encode('utf-8')
+        if not token.startswith(_FERNET_TOKEN_PREFIX):
+            # Values written by earlier releases wrapped the token in a second base64 layer
+            try:
+                token = base64.urlsafe_b64decode(token)
+            except Exception as e:
+                raise SecurityError(f"Decryption failed: {str(e)}")
+        return self.decrypt_bytes(token).decode('utf-8')
     
     def encrypt_dict(self, data: Dict[str, Any]) -> str:
         """Encrypt dictionary data."""
-        import json
-        json_data = json.dumps(data, default=str)
-        return self.encrypt(json_data)
+        return self.encrypt_dict_bytes(data).decode('ascii')
     
     def decrypt_dict(self, encrypted_data: str) -> Dict[str, Any]:
         """Decrypt to dictionary data."""
-        import json
         decrypted_json = self.decrypt(encrypted_data)
-        return json.loads(decrypted_json)
+        return orjson.loads(decrypted_json)
+    
+    def encrypt_dict_bytes(self, data: Dict[str, Any]) -> bytes:
+        """Encrypt dictionary data to Fernet token bytes for binary columns."""
+        # orjson serializes datetime/UUID natively and returns bytes, so the
+        # payload goes straight to Fernet
+        json_data = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return self.encrypt_bytes(json_data)
+    
+    def decrypt_dict_bytes(self, token: bytes) -> Dict[str, Any]:
+        """Decrypt Fernet token bytes to dictionary data."""
+        return orjson.loads(self.decrypt_bytes(token))
+
+
+@lru_cache(maxsize=None)
+def get_encryptor(encryption_key: str) -> HIPAAEncryption:
+    """Get the shared encryptor for a key, creating it on first use."""
+    return HIPAAEncryption(encryption_key)
 
 
 class PatientDataEncryption(HIPAAEncryption):
@@ -94,15 +206,21 @@ class PatientDataEncryption(HIPAAEncryption):
         super().__init__(settings.patient_data_encryption_key)
     
     def anonymize_patient_id(self, patient_id: str) -> str:
-        """Create anonymized patient identifier."""
-        # Create deterministic but irreversible hash
-        salt = "patient_anonymization_salt_v1"
-        combined = f"{patient_id}{salt}"
-        hash_obj = hashlib.sha256(combined.encode())
-        return f"anon_{hash_obj.hexdigest()[:16]}"
-    
-    def encrypt_pii(self, pii_data: Dict[str, Any]) -> str:
-        """Encrypt personally identifiable information."""
+        """
+        Create anonymized patient identifier.
+        Deliberately a fast deterministic hash, not bcrypt - it runs on every
+        patient lookup and must map the same id to the same value.
+        """
+        # Create deterministic but irreversible keyed hash (16 hex chars)
+        hash_obj = hashlib.blake2b(patient_id.encode(), key=_ANONYMIZATION_KEY, digest_size=8)
+        return "anon_" + hash_obj.hexdigest()
+    
+    def encrypt_pii(self, pii_data: Union[Dict[str, Any], bytes]) -> str:
+        """Encrypt personally identifiable information (a dict or pre-serialized JSON bytes)."""
+        if isinstance(pii_data, bytes):
+            # Already JSON (e.g. from model_dump_json); embed it without re-parsing
+            pii_data = orjson.Fragment(pii_data)
+        
         # Add metadata for compliance tracking
         encrypted_pii = {
             "data": pii_data,
@@ -121,7 +239,7 @@ class HIPAAPasswordContext:
         self.pwd_context = CryptContext(
             schemes=["bcrypt"],
             deprecated="auto",
-            bcrypt__rounds=12,  # Strong rounds for healthcare data
+            bcrypt__rounds=settings.bcrypt_rounds,  # Strong rounds (default 12) for healthcare data
         )
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -129,13 +247,21 @@ class HIPAAPasswordContext:
         return self.pwd_context.verify(plain_password, hashed_password)
     
     def get_password_hash(self, password: str) -> str:
-        """Generate password hash."""
+        """Generate password hash (login credentials only - bcrypt is slow by design)."""
         return self.pwd_context.hash(password)
     
     def generate_secure_password(self, length: int = 16) -> str:
         """Generate cryptographically secure password."""
-        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        # Draw random bytes in blocks; bytes at or above the cutoff are rejected
+        # so the modulo mapping onto the alphabet stays unbiased
+        password = []
+        while len(password) < length:
+            for byte in secrets.token_bytes(length * 2):
+                if byte < _PASSWORD_BYTE_CUTOFF:
+                    password.append(_PASSWORD_ALPHABET[byte % len(_PASSWORD_ALPHABET)])
+                    if len(password) == length:
+                        break
+        return ''.join(password)
 
 
 class JWTManager:
@@ -147,6 +273,13 @@ class JWTManager:
         self.algorithm = settings.encryption_algorithm
         self.access_token_expire = timedelta(minutes=settings.access_token_expire_minutes)
         self.refresh_token_expire = timedelta(days=settings.refresh_token_expire_days)
+        
+        # Verified payloads keyed by token digest (never the raw token), in LRU
+        # order; verify_token may run in worker threads, hence the lock
+        self._verified: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._verified_lock = threading.Lock()
+        # Per-process key so cache digests can't be computed or probed from outside
+        self._token_cache_key_secret = secrets.token_bytes(32)
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token."""
@@ -179,12 +312,40 @@ class JWTManager:
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
     
     def verify_token(self, token: str) -> Dict[str, Any]:
-        """Verify and decode JWT token."""
+        """Verify and decode JWT token, reusing an earlier verification until it expires."""
+        payload = self.get_cached_payload(token)
+        if payload is not None:
+            return payload
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except JWTError as e:
             raise SecurityError(f"Token verification failed: {str(e)}")
+        
+        with self._verified_lock:
+            self._verified[self._token_cache_key(token)] = payload
+            if len(self._verified) > _TOKEN_CACHE_MAX_ENTRIES:
+                self._verified.popitem(last=False)
+        return payload
+    
+    def get_cached_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the payload of an already verified, unexpired token, if any."""
+        key = self._token_cache_key(token)
+        with self._verified_lock:
+            payload = self._verified.get(key)
+            if payload is None:
+                return None
+            if payload.get("exp", 0) > time.time():
+                self._verified.move_to_end(key)
+                return payload
+            del self._verified[key]
+        return None
+    
+    def _token_cache_key(self, token: str) -> bytes:
+        """Digest a token for use as a cache key (keyed BLAKE2b)."""
+        return hashlib.blake2b(
+            token.encode(), key=self._token_cache_key_secret, digest_size=16
+        ).digest()
 
 
 class HIPAAAuditLogger:
@@ -192,7 +353,14 @@ class HIPAAAuditLogger:
     
     def __init__(self):
         """Initialize audit logger."""
-        self.encryption = HIPAAEncryption(settings.database_encryption_key)
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAX_ENTRIES)
+        self._writer: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @cached_property
+    def encryption(self) -> HIPAAEncryption:
+        """Audit encryptor, derived on first use rather than at import."""
+        return get_encryptor(settings.database_encryption_key)
     
     async def log_access(
         self,
@@ -205,7 +373,34 @@ class HIPAAAuditLogger:
         user_agent: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        """Log patient data access for HIPAA compliance."""
+        """Log patient data access for HIPAA compliance; waits only while the queue is full."""
+        audit_entry = AuditLogEntry(
+            timestamp=datetime.utcnow(),
+            user_id=user_id,
+            patient_id=patient_id,
+            action=action,
+            resource=resource,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            outcome=outcome,
+            details=details
+        )
+        
+        self._ensure_writer()
+        await self._queue.put(self._serialize(audit_entry))
+    
+    def log_access_nowait(
+        self,
+        user_id: Optional[str],
+        patient_id: Optional[str],
+        action: str,
+        resource: str,
+        outcome: str = "success",
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        """Queue an audit entry for the background writer without blocking the caller."""
         audit_entry = AuditLogEntry(
             timestamp=datetime.utcnow(),
             user_id=user_id,
@@ -218,9 +413,94 @@ class HIPAAAuditLogger:
             details=details
         )
         
+        line = self._serialize(audit_entry)
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            # Never drop an audit entry - write it inline instead
+            self._write_batch([line])
+    
+    async def flush(self):
+        """Stop the background writer and write every queued entry."""
+        writer = self._writer
+        self._writer = None
+        if writer is not None and not writer.done() and self._writer_loop is asyncio.get_running_loop():
+            # A stop marker rather than cancel(): cancelling the writer inside
+            # wait_for can be swallowed on 3.11, leaving this await hanging
+            await self._queue.put(_AUDIT_WRITER_STOP)
+            done, _ = await asyncio.wait({writer}, timeout=_AUDIT_WRITER_STOP_TIMEOUT_SECONDS)
+            if not done:
+                logger.error("Audit log writer did not stop in time; draining the queue inline")
+                writer.cancel()
+        
+        batch = []
+        while not self._queue.empty():
+            line = self._queue.get_nowait()
+            if line is not _AUDIT_WRITER_STOP:
+                batch.append(line)
+        if batch:
+            self._write_batch(batch)
+    
+    def _ensure_writer(self):
+        """Start the background writer on first use, after it died, or on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._writer is not None and not self._writer.done() and self._writer_loop is loop:
+            return
+        
+        if self._writer_loop is not None and self._writer_loop is not loop:
+            # The queue is bound to the old loop; move pending entries to a fresh one
+            old_queue = self._queue
+            self._queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAX_ENTRIES)
+            while not old_queue.empty():
+                self._queue.put_nowait(old_queue.get_nowait())
+        
+        self._writer = loop.create_task(self._drain_queue())
+        self._writer.add_done_callback(self._on_writer_done)
+        self._writer_loop = loop
+    
+    @staticmethod
+    def _on_writer_done(task: asyncio.Task):
+        """Report a writer that died so the failure isn't lost; the next entry restarts it."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error(
+                "Audit log writer failed; restarting on the next audit entry"
+            )
+    
+    async def _drain_queue(self):
+        """Write queued entries in batches of up to 100 or every 5 seconds, until stopped."""
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await self._queue.get()
+            if line is _AUDIT_WRITER_STOP:
+                return
+            batch = [line]
+            deadline = loop.time() + _AUDIT_FLUSH_INTERVAL_SECONDS
+            try:
+                while len(batch) < _AUDIT_BATCH_SIZE:
+                    line = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                    if line is _AUDIT_WRITER_STOP:
+                        return
+                    batch.append(line)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                # Runs on stop and cancellation too, so a partial batch is never lost
+                self._write_batch(batch)
+    
+    @staticmethod
+    def _serialize(audit_entry: AuditLogEntry) -> bytes:
+        """Serialize an entry once, up front, to the line the writer persists."""
+        return b"AUDIT LOG: " + audit_entry.model_dump_json().encode()
+    
+    def _write_batch(self, batch: List[bytes]):
+        """Persist a batch of serialized audit entries in one write."""
         # TODO: Store in database with encryption
         # This would typically go to a separate audit database
-        print(f"AUDIT LOG: {audit_entry.model_dump()}")
+        # Flush pending text output first so lines stay in order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"\n".join(batch) + b"\n")
+        sys.stdout.buffer.flush()
 
 
 # Global instances
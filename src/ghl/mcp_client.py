@@ -4,14 +4,16 @@ Therapists never see GHL interface - only therapy-focused data.
 """
 
 import asyncio
-import json
+import itertools
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import httpx
+import orjson
 from pydantic import BaseModel
 
+from ..core.cache import TTLCache
 from ..core.config import settings
+from ..core.http import get_http_client
 from ..core.security import audit_logger, patient_encryption
 from ..models.patient import PatientResponse, SessionStatus
 from ..models.therapist import GHLCredentials, TherapistResponse
@@ -61,14 +63,34 @@ class GHLMessage(BaseModel):
     status: str  # delivered, read, failed
 
 
+# Fields _contact_from_ghl requires; payloads missing any of them are re-fetched
+_REQUIRED_CONTACT_KEYS = ("id", "dateAdded", "dateUpdated")
+
+
 class TherapyFocusedMCPClient:
     """MCP client that abstracts GHL complexity for therapists."""
     
+    # Tags applied to every patient contact created through this client
+    _DEFAULT_PATIENT_TAGS = ("therapy_patient", "hipaa_compliant")
+    
     def __init__(self, credentials: Optional[GHLCredentials] = None):
         """Initialize MCP client with optional credentials."""
         self.base_url = settings.ghl_mcp_server_url
         self.credentials = credentials
-        self.client = httpx.AsyncClient(timeout=30.0)
+        
+        # Therapy calendar id per therapist; calendars rarely change, so the
+        # lookup is only repeated when a cached id stops working
+        self._calendar_cache: Dict[str, str] = {}
+        
+        # Per-client JSON-RPC ids and the auth arguments merged into every call
+        self._request_ids = itertools.count(1)
+        self._auth_arguments: Dict[str, str] = (
+            {
+                "authorization": f"Bearer {credentials.api_key}",
+                "locationId": credentials.location_id
+            }
+            if credentials else {}
+        )
         
         # Therapy-focused field mappings (hide CRM complexity)
         self.therapy_field_mapping = {
@@ -83,6 +105,13 @@ class TherapyFocusedMCPClient:
             "risk_level": "customField.risk_assessment",
             "therapist_notes": "customField.private_notes"
         }
+        
+        # (therapy field, GHL custom field name) pairs, resolved once
+        self._therapy_custom_fields: Tuple[Tuple[str, str], ...] = tuple(
+            (therapy_field, ghl_field[len("customField."):])
+            for therapy_field, ghl_field in self.therapy_field_mapping.items()
+            if ghl_field.startswith("customField.")
+        )
     
     async def _make_mcp_request(
         self, 
@@ -104,33 +133,28 @@ class TherapyFocusedMCPClient:
         )
         
         try:
-            # Prepare MCP request
+            # Prepare MCP request, adding authentication if credentials provided
             mcp_request = {
                 "jsonrpc": "2.0",
-                "id": f"req_{datetime.utcnow().timestamp()}",
+                "id": f"req_{next(self._request_ids)}",
                 "method": method,
                 "params": {
                     "name": tool_name,
-                    "arguments": arguments
+                    "arguments": {**arguments, **self._auth_arguments}
                 }
             }
             
-            # Add authentication if credentials provided
-            if self.credentials:
-                mcp_request["params"]["arguments"]["authorization"] = f"Bearer {self.credentials.api_key}"
-                mcp_request["params"]["arguments"]["locationId"] = self.credentials.location_id
-            
             # Make request to MCP server
-            response = await self.client.post(
+            response = await get_http_client().post(
                 f"{self.base_url}/mcp",
-                json=mcp_request,
+                content=orjson.dumps(mcp_request),
                 headers={"Content-Type": "application/json"}
             )
             
             if response.status_code != 200:
                 raise MCPError(f"MCP request failed: {response.status_code}")
             
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if "error" in result:
                 raise MCPError(f"MCP error: {result['error']}")
@@ -158,6 +182,21 @@ class TherapyFocusedMCPClient:
             )
             raise MCPError(f"MCP request failed: {str(e)}")
     
+    @staticmethod
+    def _contact_from_ghl(contact_data: Dict[str, Any]) -> GHLContact:
+        """Build a GHLContact from a GHL contact payload."""
+        return GHLContact(
+            ghl_id=contact_data["id"],
+            email=contact_data.get("email"),
+            phone=contact_data.get("phone"),
+            first_name=contact_data.get("firstName"),
+            last_name=contact_data.get("lastName"),
+            tags=contact_data.get("tags", []),
+            custom_fields=contact_data.get("customFields", {}),
+            created_at=datetime.fromisoformat(contact_data["dateAdded"]),
+            updated_at=datetime.fromisoformat(contact_data["dateUpdated"])
+        )
+    
     async def create_patient_contact(
         self, 
         therapist_id: str,
@@ -171,16 +210,14 @@ class TherapyFocusedMCPClient:
             "lastName": patient_data.get("last_name", ""),
             "email": patient_data.get("email"),
             "phone": patient_data.get("phone"),
-            "tags": ["therapy_patient", "hipaa_compliant"],
+            "tags": list(self._DEFAULT_PATIENT_TAGS),
             "customFields": {}
         }
         
         # Map therapy-specific fields
-        for therapy_field, ghl_field in self.therapy_field_mapping.items():
+        for therapy_field, field_name in self._therapy_custom_fields:
             if therapy_field in patient_data:
-                if ghl_field.startswith("customField."):
-                    field_name = ghl_field.replace("customField.", "")
-                    ghl_contact_data["customFields"][field_name] = patient_data[therapy_field]
+                ghl_contact_data["customFields"][field_name] = patient_data[therapy_field]
         
         # Create contact via MCP
         result = await self._make_mcp_request(
@@ -191,18 +228,7 @@ class TherapyFocusedMCPClient:
         )
         
         # Transform result back to therapy-focused format
-        contact_data = result.get("contact", {})
-        return GHLContact(
-            ghl_id=contact_data["id"],
-            email=contact_data.get("email"),
-            phone=contact_data.get("phone"),
-            first_name=contact_data.get("firstName"),
-            last_name=contact_data.get("lastName"),
-            tags=contact_data.get("tags", []),
-            custom_fields=contact_data.get("customFields", {}),
-            created_at=datetime.fromisoformat(contact_data["dateAdded"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(contact_data["dateUpdated"].replace("Z", "+00:00"))
-        )
+        return self._contact_from_ghl(result.get("contact", {}))
     
     async def get_patient_contact(
         self, 
@@ -224,17 +250,7 @@ class TherapyFocusedMCPClient:
             if not contact_data:
                 return None
             
-            return GHLContact(
-                ghl_id=contact_data["id"],
-                email=contact_data.get("email"),
-                phone=contact_data.get("phone"),
-                first_name=contact_data.get("firstName"),
-                last_name=contact_data.get("lastName"),
-                tags=contact_data.get("tags", []),
-                custom_fields=contact_data.get("customFields", {}),
-                created_at=datetime.fromisoformat(contact_data["dateAdded"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(contact_data["dateUpdated"].replace("Z", "+00:00"))
-            )
+            return self._contact_from_ghl(contact_data)
             
         except MCPError:
             return None
@@ -248,6 +264,7 @@ class TherapyFocusedMCPClient:
         """Schedule therapy session (abstracted from GHL calendar complexity)."""
         
         # Find or create therapy calendar
+        calendar_was_cached = therapist_id in self._calendar_cache
         calendar_id = await self._ensure_therapy_calendar(therapist_id)
         
         # Create appointment via MCP
@@ -261,13 +278,30 @@ class TherapyFocusedMCPClient:
             "appointmentStatus": "confirmed"
         }
         
-        result = await self._make_mcp_request(
-            method="tools/call",
-            tool_name="calendars_create_appointment",
-            arguments=appointment_data,
-            therapist_id=therapist_id,
-            patient_id=patient_contact_id
-        )
+        try:
+            result = await self._make_mcp_request(
+                method="tools/call",
+                tool_name="calendars_create_appointment",
+                arguments=appointment_data,
+                therapist_id=therapist_id,
+                patient_id=patient_contact_id
+            )
+        except MCPError:
+            # The cached calendar may have been removed in GHL; look it up again once
+            if not calendar_was_cached:
+                raise
+            stale_calendar_id = calendar_id
+            calendar_id = await self._ensure_therapy_calendar(therapist_id, refresh=True)
+            if calendar_id == stale_calendar_id:
+                raise
+            appointment_data["calendarId"] = calendar_id
+            result = await self._make_mcp_request(
+                method="tools/call",
+                tool_name="calendars_create_appointment",
+                arguments=appointment_data,
+                therapist_id=therapist_id,
+                patient_id=patient_contact_id
+            )
         
         # Transform to therapy-focused format
         appointment = result.get("appointment", {})
@@ -277,8 +311,8 @@ class TherapyFocusedMCPClient:
             calendar_id=calendar_id,
             title=appointment["title"],
             description=appointment.get("description"),
-            start_time=datetime.fromisoformat(appointment["startTime"].replace("Z", "+00:00")),
-            end_time=datetime.fromisoformat(appointment["endTime"].replace("Z", "+00:00")),
+            start_time=datetime.fromisoformat(appointment["startTime"]),
+            end_time=datetime.fromisoformat(appointment["endTime"]),
             status=SessionStatus.SCHEDULED,
             location=appointment.get("location"),
             notes=appointment.get("notes")
@@ -330,13 +364,13 @@ class TherapyFocusedMCPClient:
             status=message_result.get("status", "sent")
         )
     
-    async def get_patient_messages(
+    async def iter_patient_messages(
         self,
         therapist_id: str,
         patient_contact_id: str,
         limit: int = 50
-    ) -> List[GHLMessage]:
-        """Get patient message history (therapy-focused view)."""
+    ) -> AsyncIterator[GHLMessage]:
+        """Yield patient messages one at a time (therapy-focused view)."""
         
         result = await self._make_mcp_request(
             method="tools/call",
@@ -349,20 +383,30 @@ class TherapyFocusedMCPClient:
             patient_id=patient_contact_id
         )
         
-        messages = []
+        # Models are built lazily, so consumers that stop early skip the rest
         for msg_data in result.get("messages", []):
-            messages.append(GHLMessage(
+            yield GHLMessage(
                 ghl_id=msg_data["id"],
                 contact_id=patient_contact_id,
                 conversation_id=msg_data.get("conversationId", ""),
                 message_type=msg_data.get("type", "sms"),
                 body=msg_data.get("body", ""),
                 direction=msg_data.get("direction", "inbound"),
-                timestamp=datetime.fromisoformat(msg_data["dateAdded"].replace("Z", "+00:00")),
+                timestamp=datetime.fromisoformat(msg_data["dateAdded"]),
                 status=msg_data.get("status", "delivered")
-            ))
-        
-        return messages
+            )
+    
+    async def get_patient_messages(
+        self,
+        therapist_id: str,
+        patient_contact_id: str,
+        limit: int = 50
+    ) -> List[GHLMessage]:
+        """Get patient message history (therapy-focused view)."""
+        return [
+            message
+            async for message in self.iter_patient_messages(therapist_id, patient_contact_id, limit)
+        ]
     
     async def update_patient_therapy_data(
         self,
@@ -379,12 +423,9 @@ class TherapyFocusedMCPClient:
         }
         
         # Map therapy fields to GHL custom fields
-        for therapy_field, value in therapy_updates.items():
-            if therapy_field in self.therapy_field_mapping:
-                ghl_field = self.therapy_field_mapping[therapy_field]
-                if ghl_field.startswith("customField."):
-                    field_name = ghl_field.replace("customField.", "")
-                    ghl_updates["customFields"][field_name] = value
+        for therapy_field, field_name in self._therapy_custom_fields:
+            if therapy_field in therapy_updates:
+                ghl_updates["customFields"][field_name] = therapy_updates[therapy_field]
         
         result = await self._make_mcp_request(
             method="tools/call",
@@ -394,11 +435,20 @@ class TherapyFocusedMCPClient:
             patient_id=patient_contact_id
         )
         
-        # Return updated contact
+        # Return updated contact, fetching it only if the update response
+        # doesn't carry a complete contact (updates may echo partial payloads)
+        contact_data = result.get("contact")
+        if contact_data and all(key in contact_data for key in _REQUIRED_CONTACT_KEYS):
+            return self._contact_from_ghl(contact_data)
         return await self.get_patient_contact(therapist_id, patient_contact_id)
     
-    async def _ensure_therapy_calendar(self, therapist_id: str) -> str:
-        """Ensure therapy calendar exists for therapist."""
+    async def _ensure_therapy_calendar(self, therapist_id: str, refresh: bool = False) -> str:
+        """Ensure therapy calendar exists for therapist, reusing the known id unless refreshing."""
+        
+        if not refresh:
+            calendar_id = self._calendar_cache.get(therapist_id)
+            if calendar_id is not None:
+                return calendar_id
         
         # Get existing calendars
         result = await self._make_mcp_request(
@@ -412,6 +462,7 @@ class TherapyFocusedMCPClient:
         calendars = result.get("calendars", [])
         for calendar in calendars:
             if calendar.get("name") == "Therapy Sessions":
+                self._calendar_cache[therapist_id] = calendar["id"]
                 return calendar["id"]
         
         # Create therapy calendar if it doesn't exist
@@ -432,7 +483,10 @@ class TherapyFocusedMCPClient:
             therapist_id=therapist_id
         )
         
-        return create_result.get("calendar", {}).get("id")
+        calendar_id = create_result.get("calendar", {}).get("id")
+        if calendar_id is not None:
+            self._calendar_cache[therapist_id] = calendar_id
+        return calendar_id
     
     async def get_therapist_dashboard_data(self, therapist_id: str) -> Dict[str, Any]:
         """Get therapy-focused dashboard data (not CRM metrics)."""
@@ -440,9 +494,11 @@ class TherapyFocusedMCPClient:
         # This would aggregate data from multiple MCP calls
         # but present it in therapy-focused format
         
-        try:
-            # Get patient contacts
-            contacts_result = await self._make_mcp_request(
+        # Contacts and today's appointments are independent, so fetch both at
+        # once; a failure in one still leaves the other in the dashboard
+        today = datetime.now().date()
+        contacts_result, appointments_result = await asyncio.gather(
+            self._make_mcp_request(
                 method="tools/call",
                 tool_name="contacts_search",
                 arguments={
@@ -451,11 +507,8 @@ class TherapyFocusedMCPClient:
                     "limit": 100
                 },
                 therapist_id=therapist_id
-            )
-            
-            # Get today's appointments
-            today = datetime.now().date()
-            appointments_result = await self._make_mcp_request(
+            ),
+            self._make_mcp_request(
                 method="tools/call",
                 tool_name="calendars_get_events",
                 arguments={
@@ -463,36 +516,40 @@ class TherapyFocusedMCPClient:
                     "endDate": today.isoformat()
                 },
                 therapist_id=therapist_id
-            )
-            
-            # Process data for therapy dashboard
+            ),
+            return_exceptions=True
+        )
+        
+        errors = []
+        
+        # Process data for therapy dashboard, using safe defaults on error
+        if isinstance(contacts_result, BaseException):
+            errors.append(str(contacts_result))
+            active_patients = 0
+        else:
             active_patients = len(contacts_result.get("contacts", []))
+        
+        if isinstance(appointments_result, BaseException):
+            errors.append(str(appointments_result))
+            today_sessions = 0
+        else:
             today_sessions = len(appointments_result.get("events", []))
-            
-            return {
-                "active_patients": active_patients,
-                "todays_sessions": today_sessions,
-                "pending_messages": 0,  # Would calculate from conversations
-                "crisis_alerts": 0,     # Would come from our internal system
-                "dashboard_type": "therapy_focused",  # Not "crm_focused"
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            # Return safe defaults on error
-            return {
-                "active_patients": 0,
-                "todays_sessions": 0,
-                "pending_messages": 0,
-                "crisis_alerts": 0,
-                "dashboard_type": "therapy_focused",
-                "last_updated": datetime.utcnow().isoformat(),
-                "error": str(e)
-            }
+        
+        dashboard_data = {
+            "active_patients": active_patients,
+            "todays_sessions": today_sessions,
+            "pending_messages": 0,  # Would calculate from conversations
+            "crisis_alerts": 0,     # Would come from our internal system
+            "dashboard_type": "therapy_focused",  # Not "crm_focused"
+            "last_updated": datetime.utcnow().isoformat()
+        }
+        if errors:
+            dashboard_data["error"] = "; ".join(errors)
+        
+        return dashboard_data
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the client; the shared HTTP client is closed at shutdown."""
 
 
 # Factory function to create MCP client with therapist credentials
@@ -506,4 +563,49 @@ async def create_therapist_mcp_client(therapist: TherapistResponse) -> TherapyFo
         location_id=settings.ghl_location_id
     )
     
-    return TherapyFocusedMCPClient(credentials)
\ No newline at end of file
+    return TherapyFocusedMCPClient(credentials)
+
+
+# Pooled clients are dropped after an hour, and beyond this many therapists
+# the least recently created go first; clients share the process HTTP client,
+# so dropping one releases nothing
+_MCP_POOL_TTL_SECONDS = 3600
+_MCP_POOL_MAX_CLIENTS = 1024
+
+
+class MCPClientPool:
+    """Process-wide pool that keeps one MCP client per therapist alive across requests."""
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._clients = TTLCache(_MCP_POOL_TTL_SECONDS, _MCP_POOL_MAX_CLIENTS)
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def get(self, therapist: TherapistResponse) -> TherapyFocusedMCPClient:
+        """Get the therapist's MCP client, creating it on first use."""
+        client = self._clients.get(therapist.id)
+        if client is not None:
+            return client
+        
+        # Only one request creates the client when several arrive at once
+        lock = self._locks.get(therapist.id)
+        if lock is None:
+            lock = self._locks[therapist.id] = asyncio.Lock()
+        async with lock:
+            client = self._clients.get(therapist.id)
+            if client is None:
+                client = await create_therapist_mcp_client(therapist)
+                self._clients.set(therapist.id, client)
+        
+        # Waiters already hold the lock object, so it can go once the client exists
+        self._locks.pop(therapist.id, None)
+        return client
+    
+    async def close(self):
+        """Drop every pooled client."""
+        self._clients.clear()
+        self._locks.clear()
+
+
+# Global instance
+mcp_pool = MCPClientPool()
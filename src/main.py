@@ -2,22 +2,47 @@
 Main FastAPI application for HIPAA-compliant mental health chatbot.
 """
 
+import asyncio
+import hashlib
 import logging
+import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Tuple
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
+import orjson
+from starlette.background import BackgroundTask, BackgroundTasks
 import uvicorn
 
 from .api.therapist_interface import router as therapist_router
-from .api.patient_chatbot import router as patient_router
+from .api.patient_chatbot import (
+    MAX_CHAT_MESSAGE_BODY_BYTES,
+    router as patient_router,
+)
 from .core.config import settings
-from .core.security import audit_logger
+from .core.database import close_database
+from .core.http import close_http_client
+from .core.security import audit_identity, audit_logger, bind_audit_identity
+from .ghl.mcp_client import mcp_pool
+
+
+# Environment flags are fixed for the life of the process
+_IS_DEV = settings.is_development
+_IS_PROD = settings.is_production
+_HIPAA_MODE = settings.hipaa_compliant_mode
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (native datetime/UUID support)."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 @asynccontextmanager
@@ -27,7 +52,12 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting HIPAA-compliant mental health chatbot")
     logger.info(f"Environment: {settings.environment}")
-    logger.info(f"HIPAA compliance mode: {settings.hipaa_compliant_mode}")
+    logger.info(f"HIPAA compliance mode: {_HIPAA_MODE}")
+    
+    # Run new tasks eagerly so ones that finish without suspending (queued audit
+    # writes, cache hits) skip a trip through the scheduler (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     
     # Log application startup
     await audit_logger.log_access(
@@ -38,7 +68,7 @@ async def lifespan(app: FastAPI):
         outcome="success",
         details={
             "environment": settings.environment,
-            "hipaa_mode": settings.hipaa_compliant_mode,
+            "hipaa_mode": _HIPAA_MODE,
             "version": "1.0.0"
         }
     )
@@ -47,6 +77,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down mental health chatbot")
+    await mcp_pool.close()
+    await close_http_client()
+    await close_database()
     await audit_logger.log_access(
         user_id="system",
         patient_id=None,
@@ -54,6 +87,7 @@ async def lifespan(app: FastAPI):
         resource="application",
         outcome="success"
     )
+    await audit_logger.flush()
 
 
 # Create FastAPI application
@@ -61,21 +95,46 @@ app = FastAPI(
     title="Mental Health AI Chatbot",
     description="HIPAA-compliant AI chatbot for mental health therapists built on GoHighLevel foundation",
     version="1.0.0",
-    docs_url="/docs" if settings.is_development else None,
-    redoc_url="/redoc" if settings.is_development else None,
-    openapi_url="/openapi.json" if settings.is_development else None,
+    docs_url="/docs" if _IS_DEV else None,
+    redoc_url="/redoc" if _IS_DEV else None,
+    openapi_url="/openapi.json" if _IS_DEV else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+
+# Reject oversized chat messages before the body is read. Registered before
+# the security and CORS middleware so they wrap it: the 413 gets CORS headers
+# and untrusted hosts are refused first
+@app.middleware("http")
+async def limit_chat_message_size(request: Request, call_next):
+    """Return 413 for chat messages whose declared size cannot be valid."""
+    
+    if request.method == "POST" and request.url.path == "/chat/message":
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > MAX_CHAT_MESSAGE_BODY_BYTES:
+            return ORJSONResponse(
+                status_code=413,
+                content={
+                    "error": "Message too large",
+                    "status_code": 413,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "path": request.url.path
+                }
+            )
+    
+    return await call_next(request)
+
+
 # Security middleware
-if settings.is_production:
+if _IS_PROD:
     app.add_middleware(
         TrustedHostMiddleware, 
         allowed_hosts=["yourdomain.com", "*.yourdomain.com"]
     )
 
 # CORS middleware (restrictive for production)
-allowed_origins = ["http://localhost:3000"] if settings.is_development else ["https://yourdomain.com"]
+allowed_origins = ["http://localhost:3000"] if _IS_DEV else ["https://yourdomain.com"]
 
 app.add_middleware(
     CORSMiddleware,
@@ -92,8 +151,9 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with audit logging."""
     
     # Log the exception
-    await audit_logger.log_access(
-        user_id=getattr(request.state, "user_id", None),
+    identity = audit_identity.get()
+    audit_logger.log_access_nowait(
+        user_id=identity.user_id if identity is not None else None,
         patient_id=None,
         action="http_exception",
         resource=str(request.url),
@@ -106,7 +166,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -122,8 +182,9 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with audit logging."""
     
     # Log the exception
-    await audit_logger.log_access(
-        user_id=getattr(request.state, "user_id", None),
+    identity = audit_identity.get()
+    audit_logger.log_access_nowait(
+        user_id=identity.user_id if identity is not None else None,
         patient_id=None,
         action="general_exception",
         resource=str(request.url),
@@ -139,9 +200,9 @@ async def general_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unhandled exception: {exc}")
     
     # Return generic error in production
-    error_detail = str(exc) if settings.is_development else "Internal server error"
+    error_detail = str(exc) if _IS_DEV else "Internal server error"
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": error_detail,
@@ -152,21 +213,76 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Health payloads per path with their expiry; probes poll these far more
+# often than the underlying status changes
+_HEALTH_CACHE_TTL_SECONDS = {"/health": 5.0, "/health/detailed": 15.0}
+_health_cache: Dict[str, Tuple[float, bytes]] = {}
+
+
+def _cached_health_response(path: str, build_body: Callable[[], bytes]) -> Response:
+    """Serve a health payload from cache, rebuilding it once per TTL window."""
+    
+    cached = _health_cache.get(path)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return Response(content=cached[1], media_type="application/json")
+    
+    try:
+        body = build_body()
+    except Exception:
+        # Serve the last good payload so probes don't flap during a blip
+        if cached is None:
+            raise
+        logger.warning(f"Health check for {path} failed; serving cached status")
+        return Response(content=cached[1], media_type="application/json")
+    
+    _health_cache[path] = (now + _HEALTH_CACHE_TTL_SECONDS[path], body)
+    return Response(content=body, media_type="application/json")
+
+
 # Health check endpoints
 @app.get("/health")
 async def health_check():
     """Basic health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-        "environment": settings.environment
-    }
+    return _cached_health_response("/health", _build_health)
+
+
+# Constant part of the basic health payload, serialized once with its closing
+# brace dropped so only the timestamp is appended per build
+_HEALTH_PAYLOAD_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "environment": settings.environment
+})[:-1]
+
+
+def _build_health() -> bytes:
+    """Build the basic health payload."""
+    timestamp = datetime.utcnow().isoformat().encode()
+    return _HEALTH_PAYLOAD_PREFIX + b',"timestamp":"' + timestamp + b'"}'
 
 
 @app.get("/health/detailed")
 async def detailed_health_check():
     """Detailed health check with system status."""
+    return _cached_health_response("/health/detailed", _build_detailed_health)
+
+
+# Static sections of the detailed health payload, serialized once without the
+# opening brace so the per-build status and checks are spliced in front
+_DETAILED_HEALTH_STATIC_SECTIONS = orjson.dumps({
+    "version": "1.0.0",
+    "environment": settings.environment,
+    "compliance": {
+        "hipaa_mode": _HIPAA_MODE,
+        "audit_retention_days": settings.audit_log_retention_days,
+        "data_encryption": "enabled" if _HIPAA_MODE else "disabled"
+    }
+})[1:]
+
+
+def _build_detailed_health() -> bytes:
+    """Build the detailed health payload."""
     
     # Check various system components
     checks = {
@@ -174,55 +290,60 @@ async def detailed_health_check():
         "database": "unknown",  # Would check actual database
         "ghl_mcp": "unknown",   # Would check MCP server
         "ai_models": "unknown", # Would check AI model availability
-        "encryption": "healthy" if settings.hipaa_compliant_mode else "disabled",
+        "encryption": "healthy" if _HIPAA_MODE else "disabled",
         "audit_logging": "active"
     }
     
     # Determine overall status
-    overall_status = "healthy" if all(check != "error" for check in checks.values()) else "degraded"
+    overall_status = "degraded" if "error" in checks.values() else "healthy"
     
-    return {
-        "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0",
-        "environment": settings.environment,
-        "checks": checks,
-        "compliance": {
-            "hipaa_mode": settings.hipaa_compliant_mode,
-            "audit_retention_days": settings.audit_log_retention_days,
-            "data_encryption": "enabled" if settings.hipaa_compliant_mode else "disabled"
-        }
+    return b"".join((
+        b'{"status":"', overall_status.encode(),
+        b'","timestamp":"', datetime.utcnow().isoformat().encode(),
+        b'","checks":', orjson.dumps(checks),
+        b",", _DETAILED_HEALTH_STATIC_SECTIONS
+    ))
+
+
+# Root payload never changes after startup, so it is serialized once
+_ROOT_PAYLOAD = orjson.dumps({
+    "application": "Mental Health AI Chatbot",
+    "description": "HIPAA-compliant AI chatbot for mental health therapists",
+    "version": "1.0.0",
+    "documentation": "/docs" if _IS_DEV else "Contact administrator",
+    "features": {
+        "therapist_interface": "Therapy-focused practice management",
+        "patient_chatbot": "AI-powered mental health support",
+        "crisis_detection": "Real-time risk assessment",
+        "ghl_integration": "Seamless backend with GoHighLevel",
+        "hipaa_compliance": "Full encryption and audit logging"
+    },
+    "endpoints": {
+        "therapist_dashboard": "/therapist/dashboard",
+        "patient_chat": "/chat/message",
+        "emergency_resources": "/chat/emergency-resources",
+        "health_check": "/health"
+    },
+    "security": {
+        "authentication": "JWT-based",
+        "encryption": "AES-256",
+        "audit_logging": "Full HIPAA compliance",
+        "crisis_protocols": "Automated therapist notification"
     }
+})
+
+
+# Validators for the constant root payload so proxies and clients can reuse it
+_ROOT_ETAG = '"' + hashlib.blake2b(_ROOT_PAYLOAD, digest_size=8).hexdigest() + '"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=60"}
 
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint with application information."""
-    return {
-        "application": "Mental Health AI Chatbot",
-        "description": "HIPAA-compliant AI chatbot for mental health therapists",
-        "version": "1.0.0",
-        "documentation": "/docs" if settings.is_development else "Contact administrator",
-        "features": {
-            "therapist_interface": "Therapy-focused practice management",
-            "patient_chatbot": "AI-powered mental health support",
-            "crisis_detection": "Real-time risk assessment",
-            "ghl_integration": "Seamless backend with GoHighLevel",
-            "hipaa_compliance": "Full encryption and audit logging"
-        },
-        "endpoints": {
-            "therapist_dashboard": "/therapist/dashboard",
-            "patient_chat": "/chat/message",
-            "emergency_resources": "/chat/emergency-resources",
-            "health_check": "/health"
-        },
-        "security": {
-            "authentication": "JWT-based",
-            "encryption": "AES-256",
-            "audit_logging": "Full HIPAA compliance",
-            "crisis_protocols": "Automated therapist notification"
-        }
-    }
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 # Include routers
@@ -230,23 +351,41 @@ app.include_router(therapist_router)
 app.include_router(patient_router)
 
 
+# Liveness probes and API docs touch no patient data and are outside HIPAA
+# audit scope, so they are not written to the audit log
+_UNAUDITED_PATHS = frozenset((
+    "/health",
+    "/health/detailed",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/openapi.json",
+))
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests for audit compliance."""
     
-    start_time = datetime.utcnow()
+    if request.url.path in _UNAUDITED_PATHS:
+        return await call_next(request)
+    
+    start_time = time.monotonic()
+    identity = bind_audit_identity()
     
     # Process request
     response = await call_next(request)
     
     # Calculate processing time
-    process_time = (datetime.utcnow() - start_time).total_seconds()
+    process_time = time.monotonic() - start_time
     
-    # Log the request (for audit compliance)
-    await audit_logger.log_access(
-        user_id=getattr(request.state, "user_id", None),
-        patient_id=getattr(request.state, "patient_id", None),
+    # Log the request (for audit compliance) once the body has been sent;
+    # the coroutine runs on the loop, so the enqueue stays off the threadpool.
+    audit_task = BackgroundTask(
+        audit_logger.log_access,
+        user_id=identity.user_id,
+        patient_id=identity.patient_id,
         action="http_request",
         resource=str(request.url.path),
         outcome="success" if response.status_code < 400 else "failure",
@@ -259,6 +398,10 @@ async def log_requests(request: Request, call_next):
             "content_length": response.headers.get("content-length")
         }
     )
+    if response.background is None:
+        response.background = audit_task
+    else:
+        response.background = BackgroundTasks([response.background, audit_task])
     
     return response
 
@@ -269,7 +412,11 @@ if __name__ == "__main__":
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.is_development,
+        # Each worker is a separate process with its own audit queue and
+        # clients; the reloader only supports a single process
+        workers=settings.workers,
+        reload=_IS_DEV and settings.workers == 1,
         log_level=settings.log_level.lower(),
-        access_log=True
+        access_log=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop"  # uvloop has no Windows build
     )
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Shared SQLAlchemy declarative base for all database models.
+"""
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    """Declarative base shared by every table, so all models live in one metadata registry."""
+    pass
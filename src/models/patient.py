@@ -3,17 +3,20 @@ Patient model with HIPAA-compliant data handling and anonymization.
 All patient data is encrypted and access is fully audited.
 """
 
+import re
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
-from pydantic import BaseModel, Field, validator
-from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON, Date, Integer
-from sqlalchemy.ext.declarative import declarative_base
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from sqlalchemy import String, DateTime, Boolean, Text, JSON, Date, Integer, select
+from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.security import patient_encryption, audit_logger
+from .base import Base
 
-Base = declarative_base()
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class ConsentStatus(str, Enum):
@@ -46,30 +49,30 @@ class PatientDB(Base):
     __tablename__ = "patients"
     
     # Use anonymized ID as primary key
-    id = Column(String, primary_key=True)  # anonymized_patient_id
-    therapist_id = Column(String, nullable=False)
+    id: Mapped[str] = mapped_column(String, primary_key=True)  # anonymized_patient_id
+    therapist_id: Mapped[str] = mapped_column(String, nullable=False)
     
     # All PII is encrypted
-    encrypted_personal_info = Column(Text)  # name, email, phone, address
-    encrypted_medical_info = Column(Text)   # diagnosis, medications, history
-    encrypted_session_notes = Column(Text)  # therapy notes and observations
+    encrypted_personal_info: Mapped[Optional[str]] = mapped_column(Text)  # name, email, phone, address
+    encrypted_medical_info: Mapped[Optional[str]] = mapped_column(Text)   # diagnosis, medications, history
+    encrypted_session_notes: Mapped[Optional[str]] = mapped_column(Text)  # therapy notes and observations
     
     # Non-PII metadata (can be unencrypted for queries)
-    risk_level = Column(String, default=RiskLevel.LOW)
-    consent_status = Column(String, default=ConsentStatus.PENDING)
-    consent_date = Column(DateTime)
-    last_session_date = Column(DateTime)
-    next_session_date = Column(DateTime)
-    session_count = Column(Integer, default=0)
+    risk_level: Mapped[Optional[str]] = mapped_column(String, default=RiskLevel.LOW)
+    consent_status: Mapped[Optional[str]] = mapped_column(String, default=ConsentStatus.PENDING)
+    consent_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    last_session_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    next_session_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    session_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     # GHL integration (encrypted)
-    encrypted_ghl_contact_id = Column(String)  # encrypted GHL contact reference
+    encrypted_ghl_contact_id: Mapped[Optional[str]] = mapped_column(String)  # encrypted GHL contact reference
     
     # Audit fields
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    last_accessed_at = Column(DateTime)
-    last_accessed_by = Column(String)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_accessed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    last_accessed_by: Mapped[Optional[str]] = mapped_column(String)
 
 
 class PersonalInfo(BaseModel):
@@ -123,6 +126,36 @@ class ConversationEntry(BaseModel):
     therapist_notified: bool = False
 
 
+# Crisis keywords searched for in free-text medical fields. They compile into
+# one alternation, so each field is scanned once however long the list grows
+_CRISIS_KEYWORDS = ("suicide", "self-harm", "crisis")
+_CRISIS_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_CRISIS_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+_MEDICAL_TEXT_FIELDS = (
+    "primary_diagnosis",
+    "medical_history",
+    "family_mental_health_history",
+    "substance_use_history",
+    "trauma_history",
+    "previous_therapy_experience"
+)
+_MEDICAL_LIST_FIELDS = ("secondary_diagnoses", "current_medications", "allergies")
+
+
+def _has_crisis_indicators(medical_info: MedicalInfo) -> bool:
+    """Check the medical info text fields for crisis keywords."""
+    for field_name in _MEDICAL_TEXT_FIELDS:
+        text = getattr(medical_info, field_name)
+        if text and _CRISIS_KEYWORDS_RE.search(text):
+            return True
+    for field_name in _MEDICAL_LIST_FIELDS:
+        if any(_CRISIS_KEYWORDS_RE.search(text) for text in getattr(medical_info, field_name)):
+            return True
+    return False
+
+
 class PatientBase(BaseModel):
     """Base patient model for API operations."""
     therapist_id: str
@@ -131,12 +164,12 @@ class PatientBase(BaseModel):
     risk_level: RiskLevel = RiskLevel.LOW
     consent_status: ConsentStatus = ConsentStatus.PENDING
     
-    @validator("risk_level")
-    def validate_risk_level(cls, v, values):
+    @field_validator("risk_level")
+    @classmethod
+    def validate_risk_level(cls, v, info: ValidationInfo):
         """Auto-escalate if crisis indicators present."""
-        medical_info = values.get("medical_info")
-        if medical_info and any(keyword in str(medical_info).lower() 
-                               for keyword in ["suicide", "self-harm", "crisis"]):
+        medical_info = info.data.get("medical_info")
+        if medical_info and _has_crisis_indicators(medical_info):
             return RiskLevel.CRISIS
         return v
 
@@ -146,7 +179,8 @@ class PatientCreate(PatientBase):
     initial_consent: bool = Field(..., description="Patient has provided initial consent")
     ghl_contact_id: Optional[str] = None  # Link to GHL contact if exists
     
-    @validator("initial_consent")
+    @field_validator("initial_consent")
+    @classmethod
     def validate_consent_required(cls, v):
         """Ensure consent is provided before creating patient record."""
         if not v:
@@ -179,8 +213,7 @@ class PatientResponse(BaseModel):
     display_name: str = "Anonymous Patient"  # Never show real name in responses
     initials: Optional[str] = None  # e.g., "J.D."
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PatientConversation(BaseModel):
@@ -226,13 +259,13 @@ async def encrypt_patient_data(patient_data: PatientBase) -> Dict[str, str]:
     # Encrypt personal information
     if patient_data.personal_info:
         encrypted_data["encrypted_personal_info"] = patient_encryption.encrypt_pii(
-            patient_data.personal_info.model_dump()
+            patient_data.personal_info.model_dump_json().encode()
         )
     
     # Encrypt medical information
     if patient_data.medical_info:
         encrypted_data["encrypted_medical_info"] = patient_encryption.encrypt_pii(
-            patient_data.medical_info.model_dump()
+            patient_data.medical_info.model_dump_json().encode()
         )
     
     # Log the encryption action
@@ -286,19 +319,34 @@ async def decrypt_patient_data(encrypted_data: Dict[str, str], accessing_therapi
         raise
 
 
-def create_patient_anonymized_view(patient: PatientResponse, personal_info: Optional[PersonalInfo] = None) -> PatientSummary:
-    """Create anonymized patient view for therapist interface."""
+# Dashboard flag shown for each elevated risk level
+_RISK_FLAGS = {
+    RiskLevel.CRISIS: "Crisis alert",
+    RiskLevel.HIGH: "High risk"
+}
+
+
+def create_patient_anonymized_view(
+    patient: PatientResponse,
+    personal_info: Optional[PersonalInfo] = None,
+    *,
+    now: Optional[datetime] = None
+) -> PatientSummary:
+    """
+    Create anonymized patient view for therapist interface.
+    Pass ``now`` when building many views so they share one clock reading.
+    """
     # Generate initials from personal info if available
     initials = "XX"
     if personal_info:
         first_initial = personal_info.first_name[0].upper() if personal_info.first_name else "X"
         last_initial = personal_info.last_name[0].upper() if personal_info.last_name else "X"
-        initials = f"{first_initial}.{last_initial}."
+        initials = first_initial + "." + last_initial + "."
     
     # Determine recent activity
     activity = "No recent activity"
     if patient.last_session_date:
-        days_since = (datetime.utcnow() - patient.last_session_date).days
+        days_since = ((now or datetime.utcnow()) - patient.last_session_date).days
         if days_since == 0:
             activity = "Session today"
         elif days_since == 1:
@@ -308,10 +356,9 @@ def create_patient_anonymized_view(patient: PatientResponse, personal_info: Opti
     
     # Generate flags based on patient status
     flags = []
-    if patient.risk_level == RiskLevel.CRISIS:
-        flags.append("Crisis alert")
-    elif patient.risk_level == RiskLevel.HIGH:
-        flags.append("High risk")
+    risk_flag = _RISK_FLAGS.get(patient.risk_level)
+    if risk_flag:
+        flags.append(risk_flag)
     
     if patient.consent_status != ConsentStatus.GRANTED:
         flags.append("Consent required")
@@ -324,4 +371,45 @@ def create_patient_anonymized_view(patient: PatientResponse, personal_info: Opti
         upcoming_session=patient.next_session_date,
         recent_activity=activity,
         flags=flags
-    )
\ No newline at end of file
+    )
+
+
+async def list_patient_summaries(
+    session: "AsyncSession",
+    therapist_id: str,
+    status_filter: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> List[PatientSummary]:
+    """
+    Load a page of anonymized patient summaries for a therapist.
+    Risk level, consent and session dates live on the patient row, so the
+    whole page comes from a single query - no per-patient lookups.
+    """
+    query = (
+        select(PatientDB)
+        .where(PatientDB.therapist_id == therapist_id)
+        .order_by(PatientDB.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    if status_filter == "high_risk":
+        query = query.where(PatientDB.risk_level.in_([RiskLevel.HIGH.value, RiskLevel.CRISIS.value]))
+    
+    rows = (await session.scalars(query)).all()
+    
+    now = datetime.utcnow()
+    summaries = []
+    for row in rows:
+        personal_info = None
+        if row.encrypted_personal_info:
+            personal_info_dict = patient_encryption.decrypt_dict(row.encrypted_personal_info)
+            personal_info = PersonalInfo(**personal_info_dict["data"])
+        
+        summaries.append(create_patient_anonymized_view(
+            PatientResponse.model_validate(row),
+            personal_info,
+            now=now
+        ))
+    
+    return summaries
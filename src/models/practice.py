@@ -3,15 +3,16 @@ Practice management models for therapist chatbot platform.
 Simplified for sales/booking bot - not complex patient management.
 """
 
+from collections import Counter
 from datetime import datetime, time
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, validator
-from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON, Time
-from sqlalchemy.ext.declarative import declarative_base
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from sqlalchemy import String, DateTime, Boolean, Text, JSON, Time
+from sqlalchemy.orm import Mapped, mapped_column
 
-Base = declarative_base()
+from .base import Base
 
 
 class ServiceDelivery(str, Enum):
@@ -71,31 +72,31 @@ class PracticeDB(Base):
     """Database model for practice information."""
     __tablename__ = "practices"
     
-    id = Column(String, primary_key=True)
-    ghl_location_id = Column(String, unique=True, nullable=False)
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    ghl_location_id: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     
     # Basic Information
-    practice_name = Column(String, nullable=False)
-    practice_email = Column(String, nullable=False)
-    phone_number = Column(String)
-    website = Column(String)
-    hours_of_operation = Column(String)
+    practice_name: Mapped[str] = mapped_column(String, nullable=False)
+    practice_email: Mapped[str] = mapped_column(String, nullable=False)
+    phone_number: Mapped[Optional[str]] = mapped_column(String)
+    website: Mapped[Optional[str]] = mapped_column(String)
+    hours_of_operation: Mapped[Optional[str]] = mapped_column(String)
     
     # Configuration
-    team_size = Column(String, default=TeamSize.SOLO)
-    service_delivery = Column(String, default=ServiceDelivery.BOTH)
-    accepts_insurance = Column(Boolean, default=True)
+    team_size: Mapped[Optional[str]] = mapped_column(String, default=TeamSize.SOLO)
+    service_delivery: Mapped[Optional[str]] = mapped_column(String, default=ServiceDelivery.BOTH)
+    accepts_insurance: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Chatbot Configuration (JSON)
-    branding_config = Column(JSON)
-    appointment_config = Column(JSON)
-    bot_instructions = Column(JSON)
+    branding_config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+    appointment_config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+    bot_instructions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
     
     # Status and Metadata
-    status = Column(String, default=PracticeStatus.TRIAL)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    onboarding_completed = Column(Boolean, default=False)
+    status: Mapped[Optional[str]] = mapped_column(String, default=PracticeStatus.TRIAL)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    onboarding_completed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
 
 class PracticeBase(BaseModel):
@@ -142,8 +143,7 @@ class PracticeResponse(PracticeBase):
     appointments: AppointmentConfig
     bot_settings: BotInstructions
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class Location(BaseModel):
@@ -241,23 +241,21 @@ def create_default_bot_instructions() -> BotInstructions:
 
 def get_conversation_topics_analysis(conversations: List[ChatbotConversation]) -> Dict[str, float]:
     """Analyze conversation topics and return percentages."""
-    topic_counts = {}
     total_conversations = len(conversations)
     
     if total_conversations == 0:
         return {}
     
+    # Counter.update tallies each topic list in C
+    topic_counts = Counter()
     for conversation in conversations:
-        for topic in conversation.topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        topic_counts.update(conversation.topics)
     
-    # Convert to percentages
-    topic_percentages = {
+    # Convert to percentages, most common first
+    return {
         topic: (count / total_conversations) * 100
-        for topic, count in topic_counts.items()
+        for topic, count in topic_counts.most_common()
     }
-    
-    return dict(sorted(topic_percentages.items(), key=lambda x: x[1], reverse=True))
 
 
 def calculate_conversion_rate(conversations: List[ChatbotConversation]) -> float:
@@ -266,4 +264,24 @@ def calculate_conversion_rate(conversations: List[ChatbotConversation]) -> float
         return 0.0
     
     booked_appointments = sum(1 for conv in conversations if conv.appointment_booked)
-    return (booked_appointments / len(conversations)) * 100
\ No newline at end of file
+    return (booked_appointments / len(conversations)) * 100
+
+
+def compute_conversation_metrics(conversations: List[ChatbotConversation]) -> ConversationMetrics:
+    """Compute booking and topic metrics in a single pass over the conversations."""
+    total_conversations = len(conversations)
+    if total_conversations == 0:
+        return ConversationMetrics()
+    
+    booked_appointments = 0
+    topic_counts = Counter()
+    for conversation in conversations:
+        booked_appointments += conversation.appointment_booked
+        topic_counts.update(conversation.topics)
+    
+    return ConversationMetrics(
+        total_conversations=total_conversations,
+        appointments_booked=booked_appointments,
+        conversion_rate=(booked_appointments / total_conversations) * 100,
+        top_topics=dict(topic_counts.most_common())
+    )
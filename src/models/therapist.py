@@ -3,17 +3,22 @@ Therapist model with HIPAA-compliant data handling.
 Therapists never need direct GHL access - all interactions go through our secure layer.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 
-from pydantic import BaseModel, EmailStr, Field, validator
-from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON
-from sqlalchemy.ext.declarative import declarative_base
+import orjson
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from sqlalchemy import JSON, Boolean, DateTime, Index, String, Text, func, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, raiseload
 
-from ..core.security import patient_encryption
+from .base import Base
 
-Base = declarative_base()
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TherapistLicenseType(str, Enum):
@@ -36,6 +41,19 @@ class TherapistStatus(str, Enum):
     PENDING_VERIFICATION = "pending_verification"
 
 
+# US state codes accepted for license_state
+_VALID_STATES = frozenset((
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
+))
+
+# Characters that satisfy the password special-character requirement
+_PASSWORD_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+
 class TherapistPreferences(BaseModel):
     """Therapist preferences for chatbot behavior."""
     crisis_protocol: str = "standard"
@@ -47,80 +65,114 @@ class TherapistPreferences(BaseModel):
     session_reminders_enabled: bool = True
     progress_notes_auto_generate: bool = False
     
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+# Shared default preferences. The model is frozen and all its fields are
+# immutable, so it hashes and pydantic reuses it instead of copying per instance
+_DEFAULT_PREFERENCES = TherapistPreferences()
 
 
 class TherapistDB(Base):
     """Database model for therapist information."""
     __tablename__ = "therapists"
     
-    id = Column(String, primary_key=True)
-    email = Column(String, unique=True, nullable=False)
-    first_name = Column(String, nullable=False)
-    last_name = Column(String, nullable=False)
-    license_type = Column(String, nullable=False)
-    license_number = Column(String, nullable=False)
-    license_state = Column(String, nullable=False)
-    encrypted_credentials = Column(Text)  # Encrypted GHL credentials
-    preferences = Column(JSON)
-    status = Column(String, default=TherapistStatus.PENDING_VERIFICATION)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    last_login = Column(DateTime)
-    is_verified = Column(Boolean, default=False)
-    supervision_required = Column(Boolean, default=False)
+    __table_args__ = (
+        # Dashboard and admin listings filter on status, usually with a state
+        Index("ix_therapists_status_license_state", "status", "license_state"),
+        # Lets preference-key filters (e.g. crisis_escalation_immediate) use an index
+        Index("ix_therapists_preferences", "preferences", postgresql_using="gin"),
+        # Dashboard aggregation only ever looks at active therapists
+        Index(
+            "ix_therapists_active_verified",
+            "status",
+            "is_verified",
+            postgresql_where=text("status = 'active'")
+        ),
+    )
+    # Fetch server-generated timestamps with RETURNING instead of a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
+    
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)  # Login lookup
+    first_name: Mapped[str] = mapped_column(String, nullable=False)
+    last_name: Mapped[str] = mapped_column(String, nullable=False)
+    license_type: Mapped[str] = mapped_column(String, nullable=False)
+    license_number: Mapped[str] = mapped_column(String, nullable=False)
+    license_state: Mapped[str] = mapped_column(String, nullable=False)
+    encrypted_credentials: Mapped[Optional[str]] = mapped_column(Text)  # Encrypted GHL credentials
+    preferences: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),  # Binary storage on Postgres, plain JSON elsewhere
+        default=dict
+    )
+    status: Mapped[Optional[str]] = mapped_column(String, default=TherapistStatus.PENDING_VERIFICATION.value)
+    # Timestamps come from the database clock, so every instance agrees
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    supervision_required: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+
+
+# TherapistDB columns read by TherapistResponse.from_db
+_THERAPIST_ROW_COLUMNS = frozenset((
+    "id", "email", "first_name", "last_name", "license_type", "license_number",
+    "license_state", "encrypted_credentials", "preferences", "status", "created_at",
+    "updated_at", "last_login", "is_verified", "supervision_required"
+))
 
 
 class TherapistBase(BaseModel):
-    """Base therapist model for API operations."""
-    email: EmailStr
+    """Base therapist model for API operations (email is declared per model)."""
     first_name: str = Field(..., min_length=1, max_length=50)
     last_name: str = Field(..., min_length=1, max_length=50)
     license_type: TherapistLicenseType
     license_number: str = Field(..., min_length=1, max_length=50)
     license_state: str = Field(..., min_length=2, max_length=2)
-    preferences: TherapistPreferences = Field(default_factory=TherapistPreferences)
+    preferences: TherapistPreferences = _DEFAULT_PREFERENCES
     supervision_required: bool = False
     
-    @validator("license_state")
-    def validate_license_state(cls, v):
+    @field_validator("license_state", mode="after")
+    @classmethod
+    def validate_license_state(cls, v: str) -> str:
         """Validate US state code."""
-        valid_states = [
-            "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-            "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-            "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-            "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-            "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
-        ]
-        if v.upper() not in valid_states:
+        state = v.upper()
+        if state not in _VALID_STATES:
             raise ValueError("Invalid US state code")
-        return v.upper()
+        return state
 
 
 class TherapistCreate(TherapistBase):
     """Model for creating new therapist accounts."""
+    email: EmailStr
     password: str = Field(..., min_length=12)
     ghl_api_key: Optional[str] = None  # Optional GHL integration
     ghl_location_id: Optional[str] = None
     
-    @validator("password")
-    def validate_password(cls, v):
-        """Validate password strength for HIPAA compliance."""
-        if len(v) < 12:
-            raise ValueError("Password must be at least 12 characters long")
-        
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        if not all([has_upper, has_lower, has_digit, has_special]):
-            raise ValueError(
-                "Password must contain uppercase, lowercase, digit, and special character"
-            )
+    @field_validator("password", mode="after")
+    @classmethod
+    def validate_password(cls, v: str) -> str:
+        """Validate password strength for HIPAA compliance (length is enforced by the field)."""
+        has_upper = has_lower = has_digit = has_special = False
+        for c in v:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif c in _PASSWORD_SPECIAL_CHARACTERS:
+                has_special = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit and has_special:
+                return v
         
-        return v
+        raise ValueError(
+            "Password must contain uppercase, lowercase, digit, and special character"
+        )
 
 
 class TherapistUpdate(BaseModel):
@@ -129,11 +181,24 @@ class TherapistUpdate(BaseModel):
     last_name: Optional[str] = Field(None, min_length=1, max_length=50)
     preferences: Optional[TherapistPreferences] = None
     supervision_required: Optional[bool] = None
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TherapistUpdate":
+        """
+        Build an update from an already-validated dict without re-validating.
+        Only for internal callers: keys must be model fields and values must
+        already have the field types. Never pass request input here.
+        """
+        assert data.keys() <= cls.model_fields.keys(), "unknown TherapistUpdate fields"
+        # model_construct marks exactly these keys as set, so
+        # model_dump(exclude_unset=True) yields the partial update
+        return cls.model_construct(_fields_set=set(data), **data)
 
 
 class TherapistResponse(TherapistBase):
     """Model for therapist API responses (excludes sensitive data)."""
     id: str
+    email: str  # Validated as EmailStr when the account was created
     status: TherapistStatus
     created_at: datetime
     updated_at: datetime
@@ -141,8 +206,44 @@ class TherapistResponse(TherapistBase):
     is_verified: bool
     has_ghl_integration: bool = False  # Whether GHL is connected
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_db(cls, row: TherapistDB) -> "TherapistResponse":
+        """
+        Build a response from a stored row without re-running validation.
+        Rows were validated on write, so only the enum columns are coerced;
+        inbound payloads still go through model_validate.
+        """
+        # Loaded column values sit in the instance __dict__; reading them there
+        # skips the instrumented attribute access per column
+        values = row.__dict__
+        if not _THERAPIST_ROW_COLUMNS.issubset(values):
+            # Expired or deferred columns must load through the attributes
+            values = {name: getattr(row, name) for name in _THERAPIST_ROW_COLUMNS}
+        
+        return cls.model_construct(
+            id=values["id"],
+            email=values["email"],
+            first_name=values["first_name"],
+            last_name=values["last_name"],
+            license_type=TherapistLicenseType(values["license_type"]),
+            license_number=values["license_number"],
+            license_state=values["license_state"],
+            preferences=TherapistPreferences.model_construct(**(values["preferences"] or {})),
+            supervision_required=bool(values["supervision_required"]),
+            status=TherapistStatus(values["status"]),
+            created_at=values["created_at"],
+            updated_at=values["updated_at"],
+            last_login=values["last_login"],
+            is_verified=bool(values["is_verified"]),
+            has_ghl_integration=values["encrypted_credentials"] is not None
+        )
+    
+    @classmethod
+    def from_db_rows(cls, rows) -> list["TherapistResponse"]:
+        """Build responses for a list of stored rows."""
+        return [cls.from_db(row) for row in rows]
 
 
 class TherapistLogin(BaseModel):
@@ -159,10 +260,23 @@ class TherapistDashboard(BaseModel):
     crisis_alerts: int = 0
     weekly_session_count: int = 0
     monthly_session_count: int = 0
-    recent_activity: List[str] = Field(default_factory=list)
+    recent_activity: list[str] = Field(default_factory=list)
     
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+# Patient encryptor, imported on first use so loading the models does not pull
+# in the crypto stack
+_patient_encryption = None
+
+
+def _get_patient_encryption():
+    """Return the shared patient encryptor, importing it on first use."""
+    global _patient_encryption
+    if _patient_encryption is None:
+        from ..core.security import patient_encryption
+        _patient_encryption = patient_encryption
+    return _patient_encryption
 
 
 class GHLCredentials(BaseModel):
@@ -173,39 +287,127 @@ class GHLCredentials(BaseModel):
     
     def encrypt(self) -> str:
         """Encrypt credentials for secure storage."""
-        return patient_encryption.encrypt_dict(self.model_dump())
+        return _get_patient_encryption().encrypt_dict(self.model_dump())
     
     @classmethod
     def decrypt(cls, encrypted_data: str) -> "GHLCredentials":
-        """Decrypt credentials from storage."""
-        decrypted_data = patient_encryption.decrypt_dict(encrypted_data)
-        return cls(**decrypted_data)
+        """Decrypt credentials from storage (repeat ciphertexts are served from cache)."""
+        api_key, location_id, webhook_url = _decrypt_credentials(encrypted_data)
+        return cls.model_construct(api_key=api_key, location_id=location_id, webhook_url=webhook_url)
+    
+    @staticmethod
+    def clear_decrypt_cache() -> None:
+        """Drop cached decrypted credentials, e.g. after a key rotation."""
+        _decrypt_credentials.cache_clear()
+
+
+# Decrypted credentials per ciphertext. Fernet tokens carry a random IV, so a
+# given ciphertext only ever maps to one credential set; the cache is per process
+_CREDENTIALS_CACHE_MAX_ENTRIES = 1024
+
+
+@lru_cache(maxsize=_CREDENTIALS_CACHE_MAX_ENTRIES)
+def _decrypt_credentials(encrypted_data: str) -> tuple[str, str, Optional[str]]:
+    """Decrypt and validate stored credentials once per ciphertext."""
+    credentials = GHLCredentials(**_get_patient_encryption().decrypt_dict(encrypted_data))
+    return credentials.api_key, credentials.location_id, credentials.webhook_url
+
+
+# Features shown in (and hidden from) the therapist interface; shared by every
+# abstraction layer, so kept immutable
+_AVAILABLE_FEATURES = (
+    "patient_conversations",
+    "session_scheduling",
+    "progress_tracking",
+    "crisis_management",
+    "documentation_assistance",
+    "appointment_reminders"
+)
+_HIDDEN_FEATURES = (  # GHL features hidden from therapist view
+    "marketing_campaigns",
+    "sales_pipeline",
+    "lead_management",
+    "business_analytics",
+    "payment_processing"
+)
+
+
+# Therapist-independent part of the abstraction layer, serialized once without
+# its opening brace so the per-therapist fields are spliced in front
+_ABSTRACTION_LAYER_STATIC = orjson.dumps({
+    "interface_type": "therapy_focused",  # Not "crm_focused"
+    "available_features": _AVAILABLE_FEATURES,
+    "hidden_features": _HIDDEN_FEATURES
+})[1:]
+
+
+@dataclass(slots=True, frozen=True)
+class TherapistAbstraction:
+    """Therapist-facing view that hides the GHL/CRM feature set."""
+    therapist_id: str
+    name: str
+    license: str
+    interface_type: str = "therapy_focused"  # Not "crm_focused"
+    available_features: tuple[str, ...] = _AVAILABLE_FEATURES
+    hidden_features: tuple[str, ...] = _HIDDEN_FEATURES
 
 
 # Utility functions for therapist management
-def create_therapist_abstraction_layer(therapist: TherapistResponse) -> dict:
+def create_therapist_abstraction_layer(therapist: TherapistResponse) -> TherapistAbstraction:
     """
     Create abstraction layer that hides GHL complexity from therapists.
     They only see patient-focused, therapy-relevant information.
     """
-    return {
+    return TherapistAbstraction(
+        therapist_id=therapist.id,
+        name=f"{therapist.first_name} {therapist.last_name}",
+        license=f"{therapist.license_type.value.upper()} - {therapist.license_state}"
+    )
+
+
+def build_abstraction_response(therapist: TherapistResponse) -> bytes:
+    """Serialize the abstraction layer to JSON, reusing the pre-serialized static fields."""
+    therapist_fields = orjson.dumps({
         "therapist_id": therapist.id,
         "name": f"{therapist.first_name} {therapist.last_name}",
-        "license": f"{therapist.license_type.value.upper()} - {therapist.license_state}",
-        "interface_type": "therapy_focused",  # Not "crm_focused"
-        "available_features": [
-            "patient_conversations",
-            "session_scheduling",
-            "progress_tracking",
-            "crisis_management",
-            "documentation_assistance",
-            "appointment_reminders"
-        ],
-        "hidden_features": [  # GHL features hidden from therapist view
-            "marketing_campaigns",
-            "sales_pipeline",
-            "lead_management",
-            "business_analytics",
-            "payment_processing"
-        ]
-    }
\ No newline at end of file
+        "license": f"{therapist.license_type.value.upper()} - {therapist.license_state}"
+    })
+    return therapist_fields[:-1] + b"," + _ABSTRACTION_LAYER_STATIC
+
+
+async def list_active_therapists(session: "AsyncSession") -> list[TherapistResponse]:
+    """
+    Load verified, active therapists for dashboard aggregation.
+    The filter matches the partial active-therapist index, and raiseload
+    turns any accidental lazy load into an error instead of an N+1.
+    """
+    query = (
+        select(TherapistDB)
+        .options(raiseload("*"))
+        .where(
+            TherapistDB.status == TherapistStatus.ACTIVE.value,
+            TherapistDB.is_verified.is_(True)
+        )
+    )
+    rows = (await session.scalars(query)).all()
+    return TherapistResponse.from_db_rows(rows)
+
+
+# Rows fetched per round trip when streaming therapists for admin listings
+_THERAPIST_STREAM_BATCH_SIZE = 500
+
+
+async def iter_therapists(session: "AsyncSession") -> AsyncIterator[TherapistResponse]:
+    """
+    Stream every therapist for admin views without loading the full table.
+    Rows arrive in server-side batches and are mapped one at a time; the
+    preferences column is already decoded by the engine's orjson deserializer.
+    """
+    query = (
+        select(TherapistDB)
+        .options(raiseload("*"))
+        .order_by(TherapistDB.id)
+        .execution_options(yield_per=_THERAPIST_STREAM_BATCH_SIZE)
+    )
+    async for row in await session.stream_scalars(query):
+        yield TherapistResponse.from_db(row)